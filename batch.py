@@ -0,0 +1,166 @@
+import argparse
+import json
+import math
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from project import ALGORITHMS, HEURISTICS, SolutionCache, run_algorithm
+
+# batch.py solves a whole file of puzzles without any prompts. Each line of the input holds one board in the same format main() asks
+# for, e.g. "1 2 3 4 5 6 7 8 0" (commas are also accepted, and blank lines and lines starting with # are skipped), and the board size is
+# worked out from the number of tiles. Any of the algorithms in project.ALGORITHMS can be used. The boards are spread over a pool of
+# worker processes and one JSON record is written per board, e.g.
+#
+#   python batch.py boards.txt --algorithm manhattan --workers 8 --time-limit 10 > results.jsonl
+#   cat boards.txt | python batch.py - --unordered --node-limit 1000000
+#
+# Records are written in input order by default, or as soon as each board finishes with --unordered. Only a bounded window of boards
+# is read ahead of the records being written, so input files of any length can be streamed through. With --cache, solutions are kept in
+# a SolutionCache file between runs, so boards that overlap with ones solved before are solved faster. Every worker starts with the
+# cache as it was when the batch started and adds its own solutions to its copy, and all the solutions of the batch are added to the
+# file once it finishes.
+#
+# The parallel hda_star algorithm starts processes of its own inside each worker, so a batch uses --workers times --search-workers
+# processes in all. --search-workers is 1 by default so that a batch never starts more processes than --workers, e.g. use
+#
+#   python batch.py hard.txt --algorithm hda_star --workers 1 --search-workers 16
+#
+# to solve a few hard boards one at a time with every core.
+
+# The cache of the worker process, set up by init_worker().
+worker_cache = None
+
+# The init_worker() function runs once in each worker process. It takes the cache file (cache_path) and the most states to keep in the
+# cache (cache_size), and loads the worker's cache from the file, or leaves the worker without a cache if cache_path is None.
+def init_worker(cache_path, cache_size):
+    global worker_cache
+    if(cache_path is not None):
+        worker_cache = SolutionCache(cache_size, cache_path)
+
+# The read_boards() function takes an open input file (f) and yields an (index, line) pair for every board in it, where the index
+# counts boards from 0 in input order.
+def read_boards(f):
+    index = 0
+    for line in f:
+        line = line.strip()
+        if(line == '' or line.startswith('#')):
+            continue
+        yield index, line
+        index += 1
+
+# The solve_one() function runs in the worker processes. It takes the board's index (index), its input line (line), the search type
+# (algorithm), the heuristic used by ida_star, bidirectional_astar and hda_star (heuristic), the per-board time and node limits
+# (time_limit and node_limit) and the number of processes hda_star uses for each board (search_workers), and returns the record for that board as a dictionary. A line that is not a valid board, or a board the
+# search fails on, e.g. because the pattern databases for its size have not been built, gets a record with the 'error' status instead
+# of stopping the whole batch.
+def solve_one(index, line, algorithm, heuristic, time_limit, node_limit, search_workers=1):
+    record = {'index': index}
+    try:
+        board = [int(i) for i in line.replace(',', ' ').split()]
+        size = math.isqrt(len(board))
+        if(size < 2 or size * size != len(board) or sorted(board) != list(range(len(board)))):
+            raise ValueError('not a square board of the tiles 0 to ' + str(len(board) - 1))
+        if(algorithm == 'distance_table' and size != 3):
+            raise ValueError('the distance table only covers the 8-puzzle')
+    except ValueError as e:
+        record['status'] = 'error'
+        record['error'] = 'Invalid board "' + line + '": ' + str(e)
+        return record
+
+    record['board'] = board
+    try:
+        result = run_algorithm(board, algorithm, heuristic, size, time_limit, node_limit, cache=worker_cache, workers=search_workers)
+    except Exception as e:
+        record['status'] = 'error'
+        record['error'] = 'Search failed on board "' + line + '": ' + repr(e)
+        return record
+    record['status'] = result.status
+    record['depth'] = result.depth
+    record['expanded_nodes'] = result.expanded_nodes
+    record['generated_nodes'] = result.generated_nodes
+    record['max_q_size'] = result.max_q_size
+    record['time'] = result.time
+    record['moves'] = result.moves
+    return record
+
+# The solve_batch() function takes an open input file (f), an open output file (out), the number of worker processes (workers), the
+# search type (algorithm), the heuristic (heuristic), the per-board limits (time_limit and node_limit), whether to keep the input order
+# (ordered), the SolutionCache file to use (cache_path, None for no cache), the most states to keep in it (cache_size) and the number
+# of processes hda_star uses for each board (search_workers), and writes one JSON line per board to out. At most window boards are being
+# solved or waiting to be written at any time, 4 per worker unless window is given. It returns the number of boards written.
+def solve_batch(f, out, workers=None, algorithm='manhattan', heuristic='manhattan', time_limit=None, node_limit=None, ordered=True, window=None, cache_path=None, cache_size=1000000, search_workers=1):
+    if(workers is None):
+        workers = os.cpu_count() or 1
+    if(window is None):
+        window = 4 * workers
+    cache = None
+    if(cache_path is not None):
+        cache = SolutionCache(cache_size, cache_path)
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(cache_path, cache_size)) as executor:
+        pending = set()
+        finished = {}
+        next_index = 0
+        written = 0
+
+        # Writes every finished record that can be written, which in input order means only those following the last one written.
+        def write_finished():
+            nonlocal next_index, written
+            if(ordered):
+                while next_index in finished:
+                    out.write(json.dumps(finished.pop(next_index)) + '\n')
+                    next_index += 1
+                    written += 1
+            else:
+                for index in list(finished):
+                    out.write(json.dumps(finished.pop(index)) + '\n')
+                    written += 1
+            out.flush()
+
+        def collect(done):
+            for future in done:
+                record = future.result()
+                finished[record['index']] = record
+                if(cache is not None and record['status'] == 'solved'):
+                    cache.record(record['board'], record['moves'], math.isqrt(len(record['board'])))
+            write_finished()
+
+        for index, line in read_boards(f):
+            while len(pending) + len(finished) >= window:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending.add(executor.submit(solve_one, index, line, algorithm, heuristic, time_limit, node_limit, search_workers))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            collect(done)
+    if(cache is not None):
+        cache.save()
+    return written
+
+def main():
+    parser = argparse.ArgumentParser(description='Solve a file of sliding puzzles and write one JSON line per board.')
+    parser.add_argument('input', nargs='?', default='-', help='file with one board per line, or - for stdin (the default)')
+    parser.add_argument('-o', '--output', default='-', help='file to write the JSON lines to, or - for stdout (the default)')
+    parser.add_argument('--algorithm', choices=ALGORITHMS, default='manhattan', help='search to run on every board')
+    parser.add_argument('--heuristic', choices=HEURISTICS, default='manhattan', help='heuristic used by the ida_star, bidirectional_astar and hda_star algorithms')
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes, one per core by default')
+    parser.add_argument('--search-workers', type=int, default=1, help='number of processes hda_star uses for each board, 1 by default')
+    parser.add_argument('--unordered', action='store_true', help='write records as boards finish instead of in input order')
+    parser.add_argument('--time-limit', type=float, default=None, help='seconds each board may search for')
+    parser.add_argument('--node-limit', type=int, default=None, help='nodes each board may expand')
+    parser.add_argument('--cache', default=None, help='file to keep solutions in between runs')
+    parser.add_argument('--cache-size', type=int, default=1000000, help='most board states to keep in the cache')
+    args = parser.parse_args()
+
+    f = sys.stdin if args.input == '-' else open(args.input)
+    out = sys.stdout if args.output == '-' else open(args.output, 'w')
+    try:
+        solve_batch(f, out, args.workers, args.algorithm, args.heuristic, args.time_limit, args.node_limit, not args.unordered, cache_path=args.cache, cache_size=args.cache_size, search_workers=args.search_workers)
+    finally:
+        if(f is not sys.stdin):
+            f.close()
+        if(out is not sys.stdout):
+            out.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+import argparse
+import json
+import os
+import random
+import sys
+
+from project import ALGORITHMS, DISTANCE_TABLE_FILE, HEURISTICS, get_tables, ida_star_search, load_distance_table, run_algorithm
+
+# benchmark.py runs the searches over a reproducible set of random boards and reports how fast they are, so that a change that slows
+# down a search or makes it use more memory shows up from one run to the next. The boards are made by random walks from the goal with a
+# seeded random number generator, and are sorted into bins by their optimal depth, so the same seed always gives the same boards and
+# every difficulty gets the same number of them. For each algorithm and bin it reports the mean expanded and generated nodes, the
+# nodes expanded per second, the mean max queue size and, with --memory, the largest peak memory. The results can be saved with
+# --output and compared with an earlier run with --compare, e.g.
+#
+#   python benchmark.py --output before.json
+#   python benchmark.py --compare before.json
+#
+# The optimal depths of 8-puzzle boards come from the distance table if it has been built, and from IDA* otherwise. To measure how the
+# parallel hda_star search scales, --workers takes a list of worker counts and hda_star is run once with each, e.g.
+#
+#   python benchmark.py --size 4 --algorithms hda_star --workers 1,2,4,8
+#
+# and its rows also show the load balance, how many times the mean number of expansions the busiest worker made.
+
+# DEFAULT_BINS holds the depth bins used for each board size, as (lowest, highest) pairs of optimal depths.
+DEFAULT_BINS = {
+    3: [(0, 9), (10, 19), (20, 24), (25, 31)],
+    4: [(0, 9), (10, 19), (20, 29), (30, 39)],
+}
+
+# NO_MEMORY_ALGORITHMS lists the algorithms whose peak memory can not be measured, as hda_star expands its Nodes in other processes.
+NO_MEMORY_ALGORITHMS = ['hda_star']
+DEFAULT_ALGORITHMS = ['uniform_cost', 'misplaced_tile', 'manhattan', 'linear_conflict', 'ida_star', 'bidirectional', 'bidirectional_astar']
+
+# The bin_label() function takes a (lowest, highest) bin (depth_bin) and returns its name, e.g. '20-24'.
+def bin_label(depth_bin):
+    return str(depth_bin[0]) + '-' + str(depth_bin[1])
+
+# The random_walk() function takes a random number generator (rng), the board size (size) and a number of moves (length), and returns
+# the board reached by making that many random moves from the goal, never undoing the move just made.
+def random_walk(rng, size, length):
+    tables = get_tables(size)
+    board = list(tables.goal_board)
+    blank = tables.cells - 1
+    prev_blank = -1
+    for _ in range(length):
+        i = rng.choice([j for j in tables.neighbours[blank] if j != prev_blank])
+        board[blank], board[i] = board[i], board[blank]
+        prev_blank = blank
+        blank = i
+    return board
+
+# The optimal_depth() function takes a board represented as a list (board) and the board size (size) and returns its optimal depth.
+def optimal_depth(board, size):
+    if(size == 3 and os.path.exists(DISTANCE_TABLE_FILE)):
+        return load_distance_table().lookup(board)
+    return ida_star_search(board, '2', size, 'linear_conflict', verbose=False).depth
+
+# The make_instances() function takes the board size (size), the depth bins (bins), the number of boards per bin (per_bin), the random
+# seed (seed) and the longest random walk to use (max_walk), and returns a dictionary from each bin's label to its boards. Walk lengths
+# are drawn at random up to max_walk, and boards are kept while their bin still has room. It gives up on bins it cannot fill after
+# 200 tries per board wanted, e.g. a depth no board of that size has.
+def make_instances(size, bins, per_bin, seed, max_walk):
+    rng = random.Random(seed)
+    instances = {bin_label(b): [] for b in bins}
+    tries = 200 * per_bin * len(bins)
+    while tries > 0 and any(len(boards) < per_bin for boards in instances.values()):
+        tries -= 1
+        board = random_walk(rng, size, rng.randint(0, max_walk))
+        depth = optimal_depth(board, size)
+        for b in bins:
+            label = bin_label(b)
+            if(b[0] <= depth <= b[1] and len(instances[label]) < per_bin and board not in instances[label]):
+                instances[label].append(board)
+    return instances
+
+# The run_benchmark() function takes the boards from make_instances() (instances), the algorithms to run (algorithms), the heuristic used
+# by ida_star and bidirectional_astar (heuristic), the per-board time and node limits (time_limit and node_limit) and whether to measure
+# memory (memory) and the worker counts to run hda_star with (workers, None for one run on every core), and returns a dictionary from
+# each algorithm to a dictionary from each bin's label to its statistics. Each hda_star run is named after its worker count, e.g.
+# 'hda_star x4'. As measuring memory slows the searches down, the memory is measured in a second run of each board so the speeds are
+# not affected, which is skipped for the algorithms in NO_MEMORY_ALGORITHMS.
+def run_benchmark(instances, algorithms, heuristic='manhattan', time_limit=None, node_limit=None, memory=False, workers=None):
+    runs = []
+    for algorithm in algorithms:
+        if(algorithm == 'hda_star' and workers is not None):
+            for count in workers:
+                runs.append((algorithm + ' x' + str(count), algorithm, count))
+        else:
+            runs.append((algorithm, algorithm, None))
+    results = {}
+    for name, algorithm, count in runs:
+        results[name] = {}
+        for label, boards in instances.items():
+            stats = {'boards': len(boards), 'solved': 0, 'expanded_nodes': 0, 'generated_nodes': 0, 'max_q_size': 0, 'time': 0.0, 'peak_memory': None, 'load_balance': None}
+            balances = []
+            for board in boards:
+                result = run_algorithm(board, algorithm, heuristic, time_limit=time_limit, node_limit=node_limit, workers=count)
+                if(result.solved()):
+                    stats['solved'] += 1
+                stats['expanded_nodes'] += result.expanded_nodes
+                stats['generated_nodes'] += result.generated_nodes
+                stats['max_q_size'] += result.max_q_size
+                stats['time'] += result.time
+                if(result.load_balance() is not None):
+                    balances.append(result.load_balance())
+                if(memory and algorithm not in NO_MEMORY_ALGORITHMS):
+                    result = run_algorithm(board, algorithm, heuristic, time_limit=time_limit, node_limit=node_limit, track_memory=True, workers=count)
+                    if(result.peak_memory is not None):
+                        stats['peak_memory'] = max(stats['peak_memory'] or 0, result.peak_memory)
+
+            # totals become means per board, except the time, which stays the total
+            if(boards):
+                stats['nodes_per_second'] = stats['expanded_nodes'] / stats['time'] if stats['time'] > 0 else 0.0
+                for key in ('expanded_nodes', 'generated_nodes', 'max_q_size'):
+                    stats[key] = stats[key] / len(boards)
+            if(balances):
+                stats['load_balance'] = sum(balances) / len(balances)
+            results[name][label] = stats
+    return results
+
+# The print_results() function takes the results of run_benchmark() (results) and, optionally, the results of an earlier run (baseline),
+# and displays a table with a row for each algorithm and bin. With a baseline, the change in nodes per second and peak memory from the
+# earlier run is shown next to each value. The load balance is only shown for parallel searches.
+def print_results(results, baseline=None):
+    print('%-20s %-7s %6s %12s %12s %20s %10s %20s %8s' % ('algorithm', 'depth', 'solved', 'expanded', 'generated', 'nodes/sec', 'max queue', 'peak memory', 'balance'))
+    for algorithm, bins in results.items():
+        for label, stats in bins.items():
+            if(stats['boards'] == 0):
+                continue
+            speed = '%.0f' % stats['nodes_per_second']
+            memory = '-' if stats['peak_memory'] is None else str(stats['peak_memory'])
+            old = None
+            if(baseline is not None):
+                old = baseline.get(algorithm, {}).get(label)
+            if(old is not None and old['boards'] > 0):
+                speed += ' (%+.1f%%)' % percent_change(old['nodes_per_second'], stats['nodes_per_second'])
+                if(stats['peak_memory'] is not None and old['peak_memory']):
+                    memory += ' (%+.1f%%)' % percent_change(old['peak_memory'], stats['peak_memory'])
+            solved = str(stats['solved']) + '/' + str(stats['boards'])
+            balance = '-' if stats.get('load_balance') is None else '%.2f' % stats['load_balance']
+            print('%-20s %-7s %6s %12.1f %12.1f %20s %10.1f %20s %8s' % (algorithm, label, solved, stats['expanded_nodes'], stats['generated_nodes'], speed, stats['max_q_size'], memory, balance))
+
+# The percent_change() function takes an old value (old) and a new value (new) and returns the change between them as a percentage.
+def percent_change(old, new):
+    if(old == 0):
+        return 0.0
+    return 100.0 * (new - old) / old
+
+# The parse_bins() function takes bins written like "0-9,10-19" (text) and returns them as a list of (lowest, highest) pairs.
+def parse_bins(text):
+    bins = []
+    for part in text.split(','):
+        low, high = part.split('-')
+        bins.append((int(low), int(high)))
+    return bins
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the sliding puzzle searches on seeded random boards binned by optimal depth.')
+    parser.add_argument('--size', type=int, default=3, help='board size, 3 for the 8-puzzle and 4 for the 15-puzzle')
+    parser.add_argument('--seed', type=int, default=170, help='random seed for making the boards')
+    parser.add_argument('--per-bin', type=int, default=10, help='number of boards in each depth bin')
+    parser.add_argument('--bins', help='depth bins like 0-9,10-19,20-24,25-31')
+    parser.add_argument('--max-walk', type=int, default=100, help='longest random walk used to make a board')
+    parser.add_argument('--algorithms', help='comma separated algorithms to run, from: ' + ', '.join(ALGORITHMS))
+    parser.add_argument('--heuristic', choices=HEURISTICS, default='manhattan', help='heuristic used by the ida_star, bidirectional_astar and hda_star algorithms')
+    parser.add_argument('--workers', help='comma separated worker counts to run hda_star with, e.g. 1,2,4')
+    parser.add_argument('--time-limit', type=float, default=None, help='seconds each board may search for')
+    parser.add_argument('--node-limit', type=int, default=None, help='nodes each board may expand')
+    parser.add_argument('--memory', action='store_true', help='also measure the peak memory of every search')
+    parser.add_argument('--output', help='file to save the results to as JSON')
+    parser.add_argument('--compare', help='JSON file of an earlier run to compare with')
+    args = parser.parse_args()
+
+    bins = parse_bins(args.bins) if args.bins else DEFAULT_BINS[args.size]
+    algorithms = args.algorithms.split(',') if args.algorithms else DEFAULT_ALGORITHMS
+    for algorithm in algorithms:
+        if(algorithm not in ALGORITHMS):
+            parser.error('Unknown algorithm ' + algorithm)
+    settings = {'size': args.size, 'seed': args.seed, 'per_bin': args.per_bin, 'bins': [bin_label(b) for b in bins], 'max_walk': args.max_walk, 'heuristic': args.heuristic}
+
+    baseline = None
+    if(args.compare):
+        with open(args.compare) as f:
+            earlier = json.load(f)
+        if(earlier['settings'] != settings):
+            print('Warning: ' + args.compare + ' was run with different settings, so its boards are not the same', file=sys.stderr)
+        baseline = earlier['results']
+
+    instances = make_instances(args.size, bins, args.per_bin, args.seed, args.max_walk)
+    workers = [int(count) for count in args.workers.split(',')] if args.workers else None
+    results = run_benchmark(instances, algorithms, args.heuristic, args.time_limit, args.node_limit, args.memory, workers)
+    print_results(results, baseline)
+    if(args.output):
+        with open(args.output, 'w') as f:
+            json.dump({'settings': settings, 'instances': instances, 'results': results}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
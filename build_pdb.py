@@ -0,0 +1,45 @@
+import argparse
+import os
+import time
+
+from project import DEFAULT_PATTERNS, build_distance_table, build_pattern_database, save_distance_table, save_pattern_database
+
+# build_pdb.py builds the pattern database files used by the pattern_database heuristic in project.py. By default it builds every
+# pattern in DEFAULT_PATTERNS for the given board size, or only the patterns given with --pattern, e.g.
+#
+#   python build_pdb.py --size 3
+#   python build_pdb.py --size 4 --pattern 2,3,4
+#
+# The files are written to project.PDB_DIRECTORY unless --directory is given. With --distance-table it builds the full 8-puzzle distance
+# table used by distance_table_search() instead.
+def main():
+    parser = argparse.ArgumentParser(description='Build pattern databases for the sliding puzzle searches.')
+    parser.add_argument('--size', type=int, default=3, help='board size, 3 for the 8-puzzle and 4 for the 15-puzzle')
+    parser.add_argument('--pattern', action='append', help='comma separated tiles of one pattern, can be given more than once')
+    parser.add_argument('--directory', help='directory to write the database files to')
+    parser.add_argument('--distance-table', action='store_true', help='build the full 8-puzzle distance table instead')
+    args = parser.parse_args()
+
+    if(args.distance_table):
+        start_time = time.time()
+        table = build_distance_table()
+        path = save_distance_table(table, None if args.directory is None else os.path.join(args.directory, '3x3-distances.bin'))
+        print('Built ' + path + ' with ' + str(len(table)) + ' entries')
+        print("-- %s seconds -- were used." % (time.time() - start_time))
+        return
+
+    if(args.pattern):
+        patterns = [[int(i) for i in p.split(',')] for p in args.pattern]
+    elif(args.size in DEFAULT_PATTERNS):
+        patterns = DEFAULT_PATTERNS[args.size]
+    else:
+        parser.error('there are no default patterns for ' + str(args.size) + 'x' + str(args.size) + ' boards, give them with --pattern')
+    for pattern in patterns:
+        start_time = time.time()
+        table = build_pattern_database(args.size, pattern)
+        path = save_pattern_database(args.size, pattern, table, args.directory)
+        print('Built ' + path + ' with ' + str(len(table)) + ' entries')
+        print("-- %s seconds -- were used." % (time.time() - start_time))
+
+if __name__ == "__main__":
+    main()
@@ -1,339 +1,1547 @@
-from queue import PriorityQueue
-import itertools
+from array import array
+from collections import OrderedDict, deque
+import json
+import math
+import mmap
+import multiprocessing
+import os
+from queue import Empty
 import time
+import tracemalloc
 
-# Board states are represented as lists of size 9, where the blank slot is represented by 0 and the puzzle is read 
-# left to right, top to bottom. For example, the solved 8-puzzle will be represented as [1,2,3,4,5,6,7,8,0].
-
-# The Node class contains 4 instance variables, a board state represented as a list shown above (board), its parent
-# state which is also represented as a list (prev_board), and a pair of integers which correspond to the g(n) and h(n)
-# values discussed in class (g and h). There are three accessor methods: get_board() which returns the Node's board 
-# state, get_prev_board() which returns the stored parent board state, and get_g() which returns the stored value of g(n).
-# There is no accessor for h, as a similar method introduced later will suffice for the scope of our program. The
-# same class is used for all three algorithms, with its values determined on instantiation.
-class Node:
-    def __init__(self, board, prev_board, g, h):
-        self.board = board
-        self.prev_board = prev_board
-        self.g = g
-        self.h = h
-
-    def get_board(self):
-        return self.board
-    
-    def get_prev_board(self):
-        return self.prev_board
-
-    def get_g(self):
-        return self.g
-
-# The get_h() function takes two parameters, a board state represented as a list (board) and a search type represented as
-# a string (search), and returns the appropriate h(n) value for 3 different heuristics. The uniform_cost heuristic is
-# hardcoded as a 0. The misplaced_tile heuristic checks each position in the board against the goal board,
-# [1,2,3,4,5,6,7,8,0], and if the correct number is not in the slot, it adds 1 to the h(n) value. The manhattan
-# heuristic sums up the distances each individual tile is from its correct slot, called the manhattan distance. 
-# In a 2-D structure, the manhattan distance uses the differences in x and y components of a tile's current and 
-# goal slot, takes their absolute values, and sums them together. We can employ this formula for our 1-D board 
-# representation using the mod function (%), where the horizontal component of a tile's current slot is the 
-# [tile's index mod 3], the horizontal component of a tile's correct slot is [(tile's value - 1) mod 3], the 
-# vertical component of a tile's current slot is [tile's index integer divided by 3], and the vertical component 
-# of a tile's correct slot is [(tile's value - 1) integer divided by 3]. Taking their absolute values and summing 
-# them together, we can calculate the manhattan distance for one tile, which we will sum with the rest of the tiles.
-def get_h(board, search):
+# Board states are represented as lists of size n*n for an n x n board, where the blank slot is represented by 0 and the puzzle is read
+# left to right, top to bottom. For example, the solved 8-puzzle will be represented as [1,2,3,4,5,6,7,8,0] and the solved 15-puzzle
+# as [1,2,...,15,0]. The board size n is passed to the functions below as an integer (size), which defaults to 3 for the 8-puzzle.
+
+# The BoardTables class holds everything about an n x n board that can be worked out ahead of time, so the search never has to
+# recompute it. It contains the board size (size), the number of slots (cells), the number of bits each tile takes up in a packed
+# state (bits, 4 for boards up to 4x4 and 5 for the 24-puzzle), the row and column of every slot (row and col), the goal row and
+# goal column of every tile (goal_row and goal_col), the goal board as a list (goal_board) and as a packed state (goal_state), and the
+# neighbour table (neighbours). neighbours[i] lists the slots that the blank at slot i can legally be swapped with, which replaces the
+# hardcoded branch for each blank position that a fixed 3x3 board would need. For updating heuristics one move at a time it also holds
+# the bit offset of every slot in a packed state (shift) and the mask for one tile (mask), the slots making up every row and column
+# (row_slots and col_slots), and per-tile tables of the manhattan distance (distance) and misplaced count (misplaced) of each tile in
+# each slot, with both set to 0 for the blank. The goal is the solved board unless a different board is passed in (goal_board), which
+# lets a search measure heuristics towards any board, e.g. the backward half of a bidirectional search heading for the initial board.
+class BoardTables:
+    def __init__(self, size, goal_board=None):
+        self.size = size
+        self.cells = size * size
+        self.bits = max(4, (self.cells - 1).bit_length())
+        self.row = [i // size for i in range(self.cells)]
+        self.col = [i % size for i in range(self.cells)]
+
+        # normally the blank (tile 0) belongs in the last slot and tile i in slot i-1
+        if(goal_board is None):
+            goal_board = list(range(1, self.cells)) + [0]
+        self.goal_board = list(goal_board)
+        self.goal_state = pack(self.goal_board)
+        self.goal_row = [0] * self.cells
+        self.goal_col = [0] * self.cells
+        for i in range(self.cells):
+            self.goal_row[goal_board[i]] = self.row[i]
+            self.goal_col[goal_board[i]] = self.col[i]
+
+        # Up (-size), left (-1), right (+1) and down (+size), as long as the move stays on the board.
+        self.neighbours = []
+        for i in range(self.cells):
+            moves = []
+            if(self.row[i] > 0):
+                moves.append(i - size)
+            if(self.col[i] > 0):
+                moves.append(i - 1)
+            if(self.col[i] < size - 1):
+                moves.append(i + 1)
+            if(self.row[i] < size - 1):
+                moves.append(i + size)
+            self.neighbours.append(moves)
+
+        self.shift = [i * self.bits for i in range(self.cells)]
+        self.mask = (1 << self.bits) - 1
+        self.row_slots = [list(range(r * size, (r + 1) * size)) for r in range(size)]
+        self.col_slots = [list(range(c, self.cells, size)) for c in range(size)]
+        self.distance = [[0] * self.cells]
+        self.misplaced = [[0] * self.cells]
+        for tile in range(1, self.cells):
+            self.distance.append([abs(self.goal_row[tile] - self.row[i]) + abs(self.goal_col[tile] - self.col[i]) for i in range(self.cells)])
+            self.misplaced.append([int(goal_board[i] != tile) for i in range(self.cells)])
+
+# BoardTables are only built once for each board size and then reused by every search. The get_tables() function takes a board size
+# (size) and returns its BoardTables, building and storing them in board_tables the first time a size is used.
+board_tables = {}
+
+def get_tables(size):
+    if(size not in board_tables):
+        board_tables[size] = BoardTables(size)
+    return board_tables[size]
+
+# While searching, board states are packed into a single integer instead of being stored as lists. Each tile takes up the number of
+# bits given by BoardTables (4 bits for boards up to 4x4), with the tile at index i of the board stored in bits i*bits to i*bits+bits-1,
+# so the whole 3x3 board fits in 36 bits and the 4x4 board fits in 64 bits. Packed states can be compared, hashed and stored in a set
+# in constant time, and moving a tile only takes a couple of integer operations instead of copying a list. The pack() function turns a
+# board list into its packed state and the unpack() function turns a packed state back into a board list, which is only needed for
+# displaying boards and computing heuristics.
+def pack(board):
+    bits = max(4, (len(board) - 1).bit_length())
+    state = 0
+    for i in reversed(board):
+        state = (state << bits) | i
+    return state
+
+def unpack(state, size=3):
+    tables = get_tables(size)
+    mask = (1 << tables.bits) - 1
+    board = []
+    for i in range(tables.cells):
+        board.append(state & mask)
+        state >>= tables.bits
+    return board
+
+# The NodeStore class keeps every Node a search creates. Instead of one object per Node, which costs a few hundred bytes once its
+# attribute dictionary is counted, each Node is a slot in a set of parallel arrays, and is referred to by its index. The arrays hold a
+# packed board state as described above (states), the index of the Node it was expanded from (parents, -1 for the initial Node), the
+# g(n) and h(n) values discussed in class (g and h), and the index of the blank tile (blanks), which is kept so expand() never has to
+# search the packed state for it and also tells which move produced the Node. Apart from the packed state, which is shared with the
+# search's dictionary of best g(n) values, a Node takes 17 bytes. The states are kept in a list, as boards larger than 4x4 do not fit
+# in 64 bits. The add() function takes the five values of a new Node and returns its index, and get_moves() takes the index of a Node
+# (index) and the board size (size), follows the parent indices back to the initial Node and returns the moves made to reach it.
+class NodeStore:
+    def __init__(self):
+        self.states = []
+        self.parents = array('i')
+        self.g = array('H')
+        self.h = array('H')
+        self.blanks = array('B')
+
+    def add(self, state, parent, g, h, blank):
+        self.states.append(state)
+        self.parents.append(parent)
+        self.g.append(g)
+        self.h.append(h)
+        self.blanks.append(blank)
+        return len(self.states) - 1
+
+    def get_moves(self, index, size=3):
+        blanks = []
+        while index >= 0:
+            blanks.append(self.blanks[index])
+            index = self.parents[index]
+        blanks.reverse()
+        return move_names(blanks, size)
+
+    def __len__(self):
+        return len(self.states)
+
+# Solutions are written as the moves of the blank, 'U' for up, 'D' for down, 'L' for left and 'R' for right, so the solution
+# 'RD' for [1,2,3,4,0,5,7,8,6] means moving the blank right and then down. The move_names() function takes the slots the blank
+# visited, starting with its slot on the initial board (blanks), and the board size (size), and returns the moves as a string.
+def move_names(blanks, size=3):
+    moves = []
+    for i in range(1, len(blanks)):
+        step = blanks[i] - blanks[i-1]
+        if(step == -size):
+            moves.append('U')
+        elif(step == size):
+            moves.append('D')
+        elif(step == -1):
+            moves.append('L')
+        else:
+            moves.append('R')
+    return ''.join(moves)
+
+# The SearchResult class is what every search function returns, so the outcome of a search can be checked by other code instead of
+# only being printed. It holds the outcome of the search as a string (status), which is 'solved' if the goal state was found,
+# 'unsolvable' if the solvability check rejected the board before searching, 'no_solution' if the whole reachable state space was
+# searched without finding the goal, and 'limit' if the search was stopped by its time or node limit. It also holds the depth of the
+# solution (depth, None unless solved), the number of expanded nodes (expanded_nodes), the number of nodes left in the queue
+# (frontier_nodes), the max queue size (max_q_size), the number of seconds the search took (time), for iterative deepening searches,
+# a list of (threshold, expanded nodes) pairs for each iteration (iterations), the solution as a string of moves (moves, see
+# move_names()), the number of child nodes generated (generated_nodes), the peak number of bytes allocated during the search if it
+# was measured (peak_memory), and if the search was profiled, a dictionary of the seconds spent computing heuristics, expanding nodes,
+# on queue operations and on duplicate checks (timings), and for parallel searches, a list of the nodes each worker expanded
+# (worker_expanded). The nodes_per_second() function returns the expanded nodes per second, the load_balance() function returns how
+# many times the mean number of expansions the busiest worker made (1.0 when the work was spread evenly, None for other searches) and
+# the to_dict() function returns every value in a dictionary, e.g. for writing out as JSON.
+class SearchResult:
+    def __init__(self, status, depth=None, expanded_nodes=0, frontier_nodes=0, max_q_size=0, time=0.0, iterations=None, moves=None, generated_nodes=0, peak_memory=None, timings=None, worker_expanded=None):
+        self.status = status
+        self.depth = depth
+        self.expanded_nodes = expanded_nodes
+        self.frontier_nodes = frontier_nodes
+        self.max_q_size = max_q_size
+        self.time = time
+        self.iterations = iterations
+        self.moves = moves
+        self.generated_nodes = generated_nodes
+        self.peak_memory = peak_memory
+        self.timings = timings
+        self.worker_expanded = worker_expanded
+
+    def solved(self):
+        return self.status == 'solved'
+
+    def nodes_per_second(self):
+        if(self.time <= 0):
+            return 0.0
+        return self.expanded_nodes / self.time
+
+    def load_balance(self):
+        if(not self.worker_expanded or sum(self.worker_expanded) == 0):
+            return None
+        return max(self.worker_expanded) * len(self.worker_expanded) / sum(self.worker_expanded)
+
+    def to_dict(self):
+        return {
+            'status': self.status,
+            'depth': self.depth,
+            'expanded_nodes': self.expanded_nodes,
+            'generated_nodes': self.generated_nodes,
+            'frontier_nodes': self.frontier_nodes,
+            'max_q_size': self.max_q_size,
+            'time': self.time,
+            'nodes_per_second': self.nodes_per_second(),
+            'peak_memory': self.peak_memory,
+            'timings': self.timings,
+            'iterations': self.iterations,
+            'worker_expanded': self.worker_expanded,
+            'load_balance': self.load_balance(),
+            'moves': self.moves,
+        }
+
+# The print_result() function takes a SearchResult (result) and the board size (size) and displays it the way the searches always have,
+# along with the moves of the solution when the search found them and the work of each worker of a parallel search.
+def print_result(result, size=3):
+    if(result.solved()):
+        print('Final board: ' + str(get_tables(size).goal_board))
+        print('Success!')
+        print('Depth: ' + str(result.depth))
+        if(result.moves is not None):
+            print('Moves: ' + (result.moves or 'none'))
+        print('Expanded Nodes: ' + str(result.expanded_nodes))
+        print('Frontier Nodes: ' + str(result.frontier_nodes))
+        print('Max Queue Size: '+ str(result.max_q_size))
+        if(result.worker_expanded is not None):
+            print('Worker Expanded Nodes: ' + str(result.worker_expanded))
+            print('Load Balance: %.2f' % (result.load_balance() or 1.0))
+    elif(result.status == 'limit'):
+        print('Search limit reached!')
+        print('Expanded Nodes: ' + str(result.expanded_nodes))
+    else:
+        print('No solution exists!')
+        if(result.status == 'no_solution'):
+            print('Expanded Nodes: ' + str(result.expanded_nodes))
+    print("-- %s seconds -- were used." % result.time)
+
+# The SearchLimit exception is raised inside a search when it goes over its time or node limit, and is caught by the search function
+# itself, which returns a SearchResult with the 'limit' status.
+class SearchLimit(Exception):
+    pass
+
+# The check_limits() function takes the number of expanded nodes (expanded_nodes), the node limit (node_limit), the time the search
+# started (start_time) and the time limit in seconds (time_limit), and raises SearchLimit if either limit is set and has been reached.
+def check_limits(expanded_nodes, node_limit, start_time, time_limit):
+    if(node_limit is not None and expanded_nodes >= node_limit):
+        raise SearchLimit()
+    if(time_limit is not None and time.time() - start_time >= time_limit):
+        raise SearchLimit()
+
+# The MemoryTracker class measures the peak memory of a search with python's tracemalloc library. It is only switched on when a search
+# is given track_memory=True, as tracing every allocation slows the search down several times. Creating one starts the measurement
+# (enabled) and the stop() function returns the peak number of bytes allocated since then, or None if it was not enabled.
+class MemoryTracker:
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.started = False
+        if(enabled):
+            if(not tracemalloc.is_tracing()):
+                tracemalloc.start()
+                self.started = True
+            tracemalloc.reset_peak()
+            self.baseline = tracemalloc.get_traced_memory()[0]
+
+    def stop(self):
+        if(not self.enabled):
+            return None
+        peak = tracemalloc.get_traced_memory()[1] - self.baseline
+        if(self.started):
+            tracemalloc.stop()
+        return peak
+
+# Every search takes an optional callback (on_expand) that is called with the packed state, g(n) value, h(n) value and board size of
+# each Node it is about to expand, which lets other code watch a search without changing it. The trace_expansion() function is the
+# callback the searches use when the trace flag is '1', which displays each Node the way the trace always has.
+def trace_expansion(state, g, h, size=3):
+    print('The next state to expand has g(n) = ' + str(g) + ' and h(n) = ' + str(h) + ':')
+    print(unpack(state, size))
+
+# The finish_search() function takes a SearchResult (result), the number of generated nodes (generated_nodes), the search's
+# MemoryTracker (memory), its timings (timings), the verbose flag (verbose) and the board size (size). It fills the values in, displays
+# the result if verbose is set and returns it.
+def finish_search(result, generated_nodes, memory, timings, verbose, size=3):
+    result.generated_nodes = generated_nodes
+    result.peak_memory = memory.stop()
+    result.timings = timings
+    if(verbose):
+        print_result(result, size)
+    return result
+
+# The is_solvable() function takes a board represented as a list (board) and returns whether the goal state can be reached from it.
+# Only half of all board states can reach the goal, and which half a board is in can be told by counting its inversions, the pairs of
+# tiles (not counting the blank) that appear in the opposite order from the goal. Every move keeps the parity of the inversion count
+# when the board width is odd, so for the 8-puzzle the board is solvable exactly when the inversion count is even. When the width is
+# even, a vertical move changes the inversion parity and also moves the blank one row, so the board is solvable exactly when the
+# inversion count plus the number of rows between the blank and the bottom row is even.
+def is_solvable(board):
+    width = math.isqrt(len(board))
+    tiles = [i for i in board if i != 0]
+    inversions = 0
+    for i in range(len(tiles)):
+        for j in range(i+1, len(tiles)):
+            if(tiles[i] > tiles[j]):
+                inversions += 1
+    if(width % 2 == 1):
+        return inversions % 2 == 0
+    blank_row = board.index(0) // width
+    return (inversions + (width - 1 - blank_row)) % 2 == 0
+
+# Pattern databases give a much stronger heuristic than misplaced_tile or manhattan. A pattern is a group of tiles, and its database
+# stores, for every way those tiles can be placed on the board, the fewest moves of those tiles needed to bring them all home when every
+# other tile is treated as interchangeable. If the patterns are disjoint and only moves of a pattern's own tiles are counted, the values
+# of several patterns can be added together and the sum still never overestimates, e.g. the 6-6-3 split of the 15-puzzle below. The
+# 8-puzzle uses a single pattern of all 8 tiles, which gives the exact distance to the goal. DEFAULT_PATTERNS holds the patterns used
+# for each board size, and PDB_DIRECTORY is where the database files are kept (the PUZZLE_PDB_DIR environment variable overrides it).
+DEFAULT_PATTERNS = {
+    3: [[1,2,3,4,5,6,7,8]],
+    4: [[1,5,6,9,10,13], [7,8,11,12,14,15], [2,3,4]],
+}
+PDB_DIRECTORY = os.environ.get('PUZZLE_PDB_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pdb'))
+
+# The pattern_rank() function takes a list of the slots the pattern's tiles are in (positions) and the number of slots on the board
+# (cells) and returns the index of that placement in the database. The first tile's slot is a digit out of cells, the second tile's
+# slot is a digit out of the cells - 1 slots that are still free and so on, so every placement gets its own index between 0 and
+# cells!/(cells-k)! - 1 for a pattern of k tiles, with no space wasted on placements where two tiles share a slot.
+def pattern_rank(positions, cells):
+    rank = 0
+    used = 0
+    for i in range(len(positions)):
+        p = positions[i]
+        rank = rank * (cells - i) + p - bin(used & ((1 << p) - 1)).count('1')
+        used |= 1 << p
+    return rank
+
+# The pattern_file() function takes a board size (size), a pattern (pattern) and a directory (directory) and returns the path of the
+# database file for that pattern, e.g. pdb/4x4-2_3_4.pdb.
+def pattern_file(size, pattern, directory=None):
+    if(directory is None):
+        directory = PDB_DIRECTORY
+    name = str(size) + 'x' + str(size) + '-' + '_'.join(str(i) for i in pattern) + '.pdb'
+    return os.path.join(directory, name)
+
+# The build_pattern_database() function takes a board size (size) and a pattern (pattern) and returns the database for it as a
+# bytearray with one byte per placement. It is built by a breadth-first search backwards from the goal over the abstract states made
+# up of the slots of the pattern's tiles and the slot of the blank. Moving one of the pattern's tiles costs 1 and moving any other tile
+# costs 0, so zero cost moves are added to the front of the deque and the rest to the back, which keeps the deque sorted by cost. Once
+# every abstract state has its cost, each placement gets the smallest cost over all blank slots, since the blank is not part of the
+# stored index. This is meant to be run offline through build_pdb.py, as the larger 15-puzzle patterns take a long time in python.
+def build_pattern_database(size, pattern):
+    tables = get_tables(size)
+    cells = tables.cells
+    entries = math.perm(cells, len(pattern))
+    unseen = 255
+    costs = bytearray([unseen]) * (entries * cells)
+    start = tuple(tables.goal_board.index(i) for i in pattern)
+    start_blank = cells - 1
+    costs[pattern_rank(start, cells) * cells + start_blank] = 0
+    q = deque([(start, start_blank, 0)])
+    while q:
+        positions, blank, cost = q.popleft()
+        if(costs[pattern_rank(positions, cells) * cells + blank] < cost):
+            continue
+        for i in tables.neighbours[blank]:
+            # the tile in slot i moves into the blank, leaving the blank in slot i
+            if(i in positions):
+                tile = positions.index(i)
+                child = positions[:tile] + (blank,) + positions[tile+1:]
+                child_cost = cost + 1
+            else:
+                child = positions
+                child_cost = cost
+            index = pattern_rank(child, cells) * cells + i
+            if(child_cost < costs[index]):
+                costs[index] = child_cost
+                if(child_cost == cost):
+                    q.appendleft((child, i, child_cost))
+                else:
+                    q.append((child, i, child_cost))
+
+    table = bytearray(entries)
+    for rank in range(entries):
+        table[rank] = min(costs[rank * cells:(rank + 1) * cells])
+    return table
+
+# Database files start with the 4 bytes PDB1, then one byte each for the board size and the number of tiles in the pattern, then one
+# byte for each of the pattern's tiles, followed by the table itself with one byte per placement. The save_pattern_database() function
+# takes a board size (size), a pattern (pattern), its table (table) and a directory (directory), writes the file and returns its path.
+def save_pattern_database(size, pattern, table, directory=None):
+    path = pattern_file(size, pattern, directory)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b'PDB1' + bytes([size, len(pattern)]) + bytes(pattern))
+        f.write(table)
+    return path
+
+# The PatternDatabase class is a database file that has been memory-mapped for lookups. It contains the board size (size), the
+# pattern's tiles (pattern), the memory map of the file (data) and where the table starts in the file (offset). Memory-mapping the file
+# means nothing is read until a lookup needs it, so loading is instant, and every process searching with the same file shares one copy
+# of it in memory. The lookup() function takes a list of the slot each tile is in (positions), indexed by tile, and returns the
+# pattern's cost.
+class PatternDatabase:
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if(self.data[:4] != b'PDB1'):
+            raise ValueError(path + ' is not a pattern database file')
+        self.size = self.data[4]
+        self.pattern = list(self.data[6:6 + self.data[5]])
+        self.offset = 6 + len(self.pattern)
+        self.cells = self.size * self.size
+
+    def lookup(self, positions):
+        return self.data[self.offset + pattern_rank([positions[i] for i in self.pattern], self.cells)]
+
+# Loaded databases are kept in pattern_databases by board size so each file is only mapped once per process. The
+# load_pattern_databases() function takes a board size (size), a list of patterns (patterns, DEFAULT_PATTERNS for the size if not
+# given) and a directory (directory), maps their files and makes them the ones get_h() uses for that board size. Sizes without
+# DEFAULT_PATTERNS, like the 24-puzzle whose 6-tile databases are too big to build here, need their patterns given.
+pattern_databases = {}
+
+def load_pattern_databases(size, patterns=None, directory=None):
+    if(patterns is None):
+        if(size not in DEFAULT_PATTERNS):
+            raise ValueError('No default patterns for ' + str(size) + 'x' + str(size) + ' boards, build databases with: python build_pdb.py --size ' + str(size) + ' --pattern <tiles> and load them with load_pattern_databases(' + str(size) + ', patterns)')
+        patterns = DEFAULT_PATTERNS[size]
+    databases = []
+    for pattern in patterns:
+        path = pattern_file(size, pattern, directory)
+        if(not os.path.exists(path)):
+            raise FileNotFoundError('No pattern database at ' + path + ', build it with: python build_pdb.py --size ' + str(size) + ' --pattern ' + ','.join(str(i) for i in pattern))
+        databases.append(PatternDatabase(path))
+    pattern_databases[size] = databases
+    return databases
+
+# The line_conflicts() function takes the tiles in one row or column of the board, in order (tiles), the index of that row or column
+# (line), whether it is a column (vertical) and the BoardTables (tables), and returns the extra moves linear conflicts add to the
+# manhattan distance for that line. Two tiles are in a linear conflict when they are both in their goal row (or column) but in the
+# wrong order, as one of them has to leave the line to let the other pass, which costs 2 moves the manhattan distance does not count.
+# The fewest tiles that have to leave the line is the number of tiles in their goal line minus the longest run of them that is already
+# in increasing goal order, so the conflict cost is twice that.
+def line_conflicts(tiles, line, vertical, tables):
+    if(vertical):
+        goals = [tables.goal_row[t] for t in tiles if t != 0 and tables.goal_col[t] == line]
+    else:
+        goals = [tables.goal_col[t] for t in tiles if t != 0 and tables.goal_row[t] == line]
+    if(len(goals) < 2):
+        return 0
+    longest = [1] * len(goals)
+    for i in range(1, len(goals)):
+        for j in range(i):
+            if(goals[j] < goals[i] and longest[j] + 1 > longest[i]):
+                longest[i] = longest[j] + 1
+    return 2 * (len(goals) - max(longest))
+
+# The get_h() function takes three parameters, a board state represented as a list (board), a search type represented as
+# a string (search) and the board size (size), and returns the appropriate h(n) value for 4 different heuristics. The
+# uniform_cost heuristic is hardcoded as a 0. The misplaced_tile heuristic checks each position in the board against the
+# goal board, [1,2,3,4,5,6,7,8,0] for the 8-puzzle, and if the correct number is not in the slot, it adds 1 to the h(n)
+# value. The manhattan heuristic sums up the distances each individual tile is from its correct slot, called the manhattan
+# distance. In a 2-D structure, the manhattan distance uses the differences in x and y components of a tile's current and
+# goal slot, takes their absolute values, and sums them together. For our 1-D board representation, the row and column of
+# each slot and the goal row and goal column of each tile are looked up in the board size's BoardTables instead of being
+# worked out with mod (%) and integer division every time. Taking the absolute values of the differences and summing them
+# together, we can calculate the manhattan distance for one tile, which we will sum with the rest of the tiles. The
+# pattern_database heuristic adds up the costs looked up in the board size's pattern databases, loading them the first time.
+# The linear_conflict heuristic is the manhattan distance plus the line_conflicts() of every row and column. Passing a BoardTables
+# built for another goal board (tables) measures every heuristic except pattern_database towards that board instead. HEURISTICS lists
+# the search types get_h() supports, and any other search type raises a ValueError.
+HEURISTICS = ['uniform_cost', 'misplaced_tile', 'manhattan', 'linear_conflict', 'pattern_database']
+
+def get_h(board, search, size=3, tables=None):
     if(search == 'uniform_cost'):
         return 0
+    if(tables is None):
+        tables = get_tables(size)
     if(search == 'misplaced_tile'):
         h = 0
-        for i in range(8):
-            if(board[i] != i+1):
-                h += 1
+        for i in range(tables.cells):
+            h += tables.misplaced[board[i]][i]
         return h
     if(search == 'manhattan'):
         h = 0
         index = 0
         for i in board:
             if i != 0:
-                horizontal_diff= abs((i-1)%3 - index%3)
-                vertical_diff = abs((i-1)//3 - index//3)
+                horizontal_diff = abs(tables.goal_col[i] - tables.col[index])
+                vertical_diff = abs(tables.goal_row[i] - tables.row[index])
                 h = h + horizontal_diff + vertical_diff
             index += 1
         return h
+    if(search == 'pattern_database'):
+        if(tables.goal_board != get_tables(size).goal_board):
+            raise ValueError('Pattern databases only measure the distance to the solved board')
+        if(size not in pattern_databases):
+            load_pattern_databases(size)
+        positions = [0] * tables.cells
+        for i in range(tables.cells):
+            positions[board[i]] = i
+        h = 0
+        for database in pattern_databases[size]:
+            h += database.lookup(positions)
+        return h
+    if(search == 'linear_conflict'):
+        h = get_h(board, 'manhattan', size, tables)
+        for line in range(size):
+            h += line_conflicts([board[i] for i in tables.row_slots[line]], line, False, tables)
+            h += line_conflicts([board[i] for i in tables.col_slots[line]], line, True, tables)
+        return h
+    raise ValueError('Unknown heuristic ' + str(search) + ', expected one of: ' + ', '.join(HEURISTICS))
+
+# The get_child_h() function works out a child's h(n) value from its parent's instead of starting over. It takes the parent's h(n)
+# value (h), the parent's and child's packed states (state and child), the slot the blank was in (a), the slot the moved tile came from
+# (b), a search type (search) and the board size (size). A move only changes where one tile is, so for the misplaced_tile and manhattan
+# heuristics the h(n) value only changes by that tile's entry in the per-tile tables. For linear_conflict the tile also leaves one line
+# and joins another, which are the columns it moved between for a sideways move or the rows for an up or down move. The order of the
+# tiles in the lines it moved along does not change, so only the conflicts of those two lines are recounted. The pattern_database
+# heuristic is looked up again in full. The tables option works the same way as in get_h().
+def get_child_h(h, state, child, a, b, search, size=3, tables=None):
+    if(search == 'uniform_cost'):
+        return 0
+    if(tables is None):
+        tables = get_tables(size)
+    tile = (state >> tables.shift[b]) & tables.mask
+    if(search == 'misplaced_tile'):
+        return h - tables.misplaced[tile][b] + tables.misplaced[tile][a]
+    if(search == 'manhattan'):
+        return h - tables.distance[tile][b] + tables.distance[tile][a]
+    if(search == 'linear_conflict'):
+        h = h - tables.distance[tile][b] + tables.distance[tile][a]
+        vertical = tables.row[a] == tables.row[b]
+        if(vertical):
+            lines = (tables.col[a], tables.col[b])
+            slots = tables.col_slots
+        else:
+            lines = (tables.row[a], tables.row[b])
+            slots = tables.row_slots
+        for line in lines:
+            h -= line_conflicts([(state >> tables.shift[i]) & tables.mask for i in slots[line]], line, vertical, tables)
+            h += line_conflicts([(child >> tables.shift[i]) & tables.mask for i in slots[line]], line, vertical, tables)
+        return h
+    return get_h(unpack(child, size), search, size, tables)
+
+# The swap() function takes a packed board state (state), two indices represented by integers (a and b), where a is the index of the
+# blank tile, and the number of bits each tile takes up (bits), and returns the packed state with the values at the two indices swapped.
+# This function does not change anything in place; it just returns the result of the swap. This function represents one operation to
+# any board state, as all 4 operations, move a tile up, left, right, or down into the blank space can be represented as a swap between
+# the blank tile and the tile that was being operated on. For example, in the nearly solved board [1,2,3,4,5,6,7,0,8], moving the 8
+# left to complete the solve would be represented as swap(__our_state__, 7, 8). A single operator function makes it easier for me to
+# visualize the board in a 1-D representation verses the standard move up/left/right/down operators that might be coded. Since the
+# blank is stored as 0, the swap only needs to clear the moved tile's bits at index b and set them at index a.
+def swap(state, a, b, bits=4):
+    tile = (state >> (bits*b)) & ((1 << bits) - 1)
+    return state - (tile << (bits*b)) + (tile << (bits*a))
 
-# The swap() function takes a board represented as a list (board), as well as two indices represented by integers (a and b), 
-# and returns a list that contains the original board with the values at the two indices swapped. This function is different 
-# from a standard swap function that swaps the inputted board's actual values; it just returns the result of the swap and leaves 
-# the inputted board's values along. This function represents one operation to any board state, as all 4 operations, move a tile 
-# up, left, right, or down into the blank space can be represented as a swap between the blank tile and the tile that was being
-# operated on. For example, in the nearly solved board [1,2,3,4,5,6,7,0,8], moving the 8 left to complete the solve would be 
-# represented as swap(__our_board__, 7, 8). A single operator function makes it easier for me to visualize the board in a 1-D 
-# representation verses the standard move up/left/right/down operators that might be coded. Note that we are making a shallow copy 
-# of the inputted board, as Python passes arguments by object reference, so without a shallow copy, we will be swapping the actual 
-# values of the input board every time this function is called. 
-def swap(board, a, b):
-    temp = list(board)
-    temp[a], temp[b] = temp[b], temp[a]
-    return temp
-
-# The expand() function takes a Node (n), the priority queue it adds new Nodes to (q), an interator (counter), and a search type 
-# represented by a string (search). The function locates the position of the blank tile, determines the possible new states to add
-# to the priority queue, and adds them accordingly with the correct constructor values base on the inputted search type. The function
-# makes sure that it does not add the Node's parent state and adds the other possible operations associated with the blank tile's position.
-# For example, if the blank tile was at index 0, or the top left corner, the only possible moves are moving the tile underneath up into 
-# the blank space or moving the tile to its right left into the blank space. This is again represented by our swap function as 
-# swap(__our_board__, 0, 3) and swap(__our_board__, 0, 1) respectively. This function does not return any values.
-def expand(n, q, counter, search):
-    b = n.get_board()
-    prev_board = n.get_prev_board()
-    new_g = n.get_g() + 1
-
-    # Blank[0] can be swapped with right (1) or down (3).
-    if(b[0] == 0):
-        # Check to not add a Node with the parent board to the priority queue 
-        if(swap(b, 0, 1) != prev_board):
-            q.put((new_g + get_h(swap(b, 0, 1), search), next(counter), Node(swap(b, 0, 1), b, new_g, get_h(swap(b, 0, 1), search))))
-        if(swap(b, 0, 3) != prev_board):
-            q.put((new_g + get_h(swap(b, 0, 3), search), next(counter), Node(swap(b, 0, 3), b, new_g, get_h(swap(b, 0, 3), search))))
-        return
-
-    # Blank[1] can be swapped with left (0), right (2), or down (4).
-    if(b[1] == 0):
-        if(swap(b, 1, 0) != prev_board):
-            q.put((new_g + get_h(swap(b, 1, 0), search), next(counter), Node(swap(b, 1, 0), b, new_g, get_h(swap(b, 1, 0), search))))
-        if(swap(b, 1, 2) != prev_board):
-            q.put((new_g + get_h(swap(b, 1, 2), search), next(counter), Node(swap(b, 1, 2), b, new_g, get_h(swap(b, 1, 2), search))))
-        if(swap(b, 1, 4) != prev_board):
-            q.put((new_g + get_h(swap(b, 1, 4), search), next(counter), Node(swap(b, 1, 4), b, new_g, get_h(swap(b, 1, 4), search))))
-        return
-
-    # Blank[2] can be swapped with left (1) or down (5).
-    if(b[2] == 0):
-        if(swap(b, 2, 1) != prev_board):
-            q.put((new_g + get_h(swap(b, 2, 1), search), next(counter), Node(swap(b, 2, 1), b, new_g, get_h(swap(b, 2, 1), search))))
-        if(swap(b, 2, 5) != prev_board):
-            q.put((new_g + get_h(swap(b, 2, 5), search), next(counter), Node(swap(b, 2, 5), b, new_g, get_h(swap(b, 2, 5), search))))
-        return
-
-    # Blank[3] can be swapped with up (0), right (4), or down (6). 
-    if(b[3] == 0):
-        if(swap(b, 3, 0) != prev_board):
-            q.put((new_g + get_h(swap(b, 3, 0), search), next(counter), Node(swap(b, 3, 0), b, new_g, get_h(swap(b, 3, 0), search))))
-        if(swap(b, 3, 4) != prev_board):
-            q.put((new_g + get_h(swap(b, 3, 4), search), next(counter), Node(swap(b, 3, 4), b, new_g, get_h(swap(b, 3, 4), search))))
-        if(swap(b, 3, 6) != prev_board):
-            q.put((new_g + get_h(swap(b, 3, 6), search), next(counter), Node(swap(b, 3, 6), b, new_g, get_h(swap(b, 3, 6), search))))
-        return
-    
-    # Blank[4] can be swapped with up (1), left (3), right (5), or down (7).
-    if(b[4] == 0):
-        if(swap(b, 4, 1) != prev_board):
-            q.put((new_g + get_h(swap(b, 4, 1), search), next(counter), Node(swap(b, 4, 1), b, new_g, get_h(swap(b, 4, 1), search))))
-        if(swap(b, 4, 3) != prev_board):
-            q.put((new_g + get_h(swap(b, 4, 3), search), next(counter), Node(swap(b, 4, 3), b, new_g, get_h(swap(b, 4, 3), search))))
-        if(swap(b, 4, 5) != prev_board):
-            q.put((new_g + get_h(swap(b, 4, 5), search), next(counter), Node(swap(b, 4, 5), b, new_g, get_h(swap(b, 4, 5), search))))
-        if(swap(b, 4, 7) != prev_board):
-            q.put((new_g + get_h(swap(b, 4, 7), search), next(counter), Node(swap(b, 4, 7), b, new_g, get_h(swap(b, 4, 7), search))))
-        return
-    
-    # Blank[5] can be swapped with up (2), left (4), or down (8).
-    if(b[5] == 0):
-        if(swap(b, 5, 2) != prev_board):
-            q.put((new_g + get_h(swap(b, 5, 2), search), next(counter), Node(swap(b, 5, 2), b, new_g, get_h(swap(b, 5, 2), search))))
-        if(swap(b, 5, 4) != prev_board):
-            q.put((new_g + get_h(swap(b, 5, 4), search), next(counter), Node(swap(b, 5, 4), b, new_g, get_h(swap(b, 5, 4), search))))
-        if(swap(b, 5, 8) != prev_board):
-            q.put((new_g + get_h(swap(b, 5, 8), search), next(counter), Node(swap(b, 5, 8), b, new_g, get_h(swap(b, 5, 8), search))))
-        return
-
-    # Blank[6] can be swapped with up (3) or right (7).
-    if(b[6] == 0):
-        if(swap(b, 6, 3) != prev_board):
-            q.put((new_g + get_h(swap(b, 6, 3), search), next(counter), Node(swap(b, 6, 3), b, new_g, get_h(swap(b, 6, 3), search))))
-        if(swap(b, 6, 7) != prev_board):
-            q.put((new_g + get_h(swap(b, 6, 7), search), next(counter), Node(swap(b, 6, 7), b, new_g, get_h(swap(b, 6, 7), search))))
-        return
-
-    # Blank[7] can be swapped with up (4), left (6), or right (8).
-    if(b[7] == 0):
-        if(swap(b, 7, 4) != prev_board):
-            q.put((new_g + get_h(swap(b, 7, 4), search), next(counter), Node(swap(b, 7, 4), b, new_g, get_h(swap(b, 7, 4), search))))
-        if(swap(b, 7, 6) != prev_board):
-            q.put((new_g + get_h(swap(b, 7, 6), search), next(counter), Node(swap(b, 7, 6), b, new_g, get_h(swap(b, 7, 6), search))))
-        if(swap(b, 7, 8) != prev_board):
-            q.put((new_g + get_h(swap(b, 7, 8), search), next(counter), Node(swap(b, 7, 8), b, new_g, get_h(swap(b, 7, 8), search))))
-        return
-
-    # Blank[8] can be swapped with up (5) or left (7).
-    if(b[8] == 0):
-        if(swap(b, 8, 5) != prev_board):
-            q.put((new_g + get_h(swap(b, 8, 5), search), next(counter), Node(swap(b, 8, 5), b, new_g, get_h(swap(b, 8, 5), search))))
-        if(swap(b, 8, 7) != prev_board):
-            q.put((new_g + get_h(swap(b, 8, 7), search), next(counter), Node(swap(b, 8, 7), b, new_g, get_h(swap(b, 8, 7), search))))
-        return
-
-# The repeated() function takes a list (board) and checks it against a list of boards (_list). repeated() returns true if the list
-# contains the board and false if the list does not. This function is used to check for repeated board states that are not immediate
-# parent states (e.g. moving the blank in a circle without changing the other tiles). This check is mainly for unsolvable boards, as
-# normally the Nodes with lower g(n) + h(n) values will be expanded first.
-def repeated(board, _list):
-    for i in _list:
-        if board == i:
-            return True
-    return False
-
-# The uniform_cost_search() function takes an initial board (init_board) and a trace flag represented as a char (trace) and performs a uniform cost search
-# for the goal state. If the goal state is found, a success message is displayed along with the depth, expanded nodes, frontier nodes,
-# and the time taken. If no goal state is found, a failure message is displayed along with the expanded nodes and time taken. If the
-# trace flag is '1', the trace for the solution is displayed as well. This method along with the other 2 searches use the python time library to display
-# the system runtime. 
-def uniform_cost_search(init_board, trace):
+# The find_blank() function takes a board represented as a list (board) and returns the index of the blank tile.
+def find_blank(board):
+    return board.index(0)
+
+# The BucketQueue class is the priority queue used by the A* searches. As f(n) and g(n) are always small whole numbers, items are kept
+# in a list of buckets indexed by f(n) instead of a heap, and each bucket is itself a list of stacks indexed by g(n). put() takes the
+# item's f(n) and g(n) values (f and g) and the item, and pushes it onto its stack. get() pops from the lowest non-empty f(n) bucket,
+# preferring the highest g(n) in it, as of two Nodes with the same f(n) the deeper one has less of its cost left to estimate and is
+# usually closer to the goal. Both run in constant time apart from stepping over emptied buckets, and unlike python's PriorityQueue
+# there is no lock to take and no tuples to compare. The lowest f(n) bucket that may be non-empty is kept in lowest and the highest
+# g(n) stack of each bucket that may be non-empty in top_g, so the empty ones are only stepped over once. qsize() and empty() work like
+# their PriorityQueue counterparts, and min_f() returns the smallest f(n) in a non-empty queue.
+class BucketQueue:
+    def __init__(self):
+        self.buckets = []
+        self.top_g = []
+        self.lowest = 0
+        self.size = 0
+
+    def put(self, f, g, item):
+        while len(self.buckets) <= f:
+            self.buckets.append([])
+            self.top_g.append(-1)
+        bucket = self.buckets[f]
+        while len(bucket) <= g:
+            bucket.append([])
+        bucket[g].append(item)
+        if(g > self.top_g[f]):
+            self.top_g[f] = g
+        if(self.size == 0 or f < self.lowest):
+            self.lowest = f
+        self.size += 1
+
+    def get(self):
+        f = self.min_f()
+        bucket = self.buckets[f]
+        g = self.top_g[f]
+        item = bucket[g].pop()
+        while g >= 0 and not bucket[g]:
+            g -= 1
+        self.top_g[f] = g
+        self.size -= 1
+        return item
+
+    def min_f(self):
+        while self.top_g[self.lowest] < 0:
+            self.lowest += 1
+        return self.lowest
+
+    def qsize(self):
+        return self.size
+
+    def empty(self):
+        return self.size == 0
+
+# The expand() function takes the index of a Node (n), the NodeStore it is in and new Nodes are added to (nodes), the BucketQueue the
+# indices of new Nodes are added to (q), a dictionary from every packed state reached so far to the smallest g(n) it was reached with
+# (best_g), a search type represented by a string (search), the board size (size) and a dictionary of profiling timings (timings). The
+# blank tile's position is stored with the Node, and the neighbour table for the board size gives the slots it can be swapped with.
+# For example, if the blank tile was at index 0 of a 3x3 board, or the top left corner, the only possible moves are moving the tile to
+# its right left into the blank space or moving the tile underneath up into the blank space, so neighbours[0] is [1, 3]. Each child
+# state is built once with swap(), and a child that best_g shows was already reached at the same or a lower cost is dropped right away
+# instead of being added to the queue and skipped when it comes out, which also drops the Node's parent state. The rest are recorded
+# in best_g and added with the correct g(n) value and the h(n) value updated from the Node's own by get_child_h(). If timings is given,
+# the time spent on these duplicate checks, on heuristics and on adding to the queue is added to it. The function returns the number
+# of Nodes it added.
+def expand(n, nodes, q, best_g, search, size=3, timings=None):
+    tables = get_tables(size)
+    state = nodes.states[n]
+    blank = nodes.blanks[n]
+    h = nodes.h[n]
+    new_g = nodes.g[n] + 1
+    generated = 0
+    for i in tables.neighbours[blank]:
+        child = swap(state, blank, i, tables.bits)
+        if(timings is None):
+            old_g = best_g.get(child)
+            if(old_g is not None and old_g <= new_g):
+                continue
+            best_g[child] = new_g
+            child_h = get_child_h(h, state, child, blank, i, search, size)
+            q.put(new_g + child_h, new_g, nodes.add(child, n, new_g, child_h, i))
+        else:
+            start = time.perf_counter()
+            old_g = best_g.get(child)
+            dominated = old_g is not None and old_g <= new_g
+            if(not dominated):
+                best_g[child] = new_g
+            checked = time.perf_counter()
+            timings['duplicates'] += checked - start
+            if(dominated):
+                continue
+            child_h = get_child_h(h, state, child, blank, i, search, size)
+            middle = time.perf_counter()
+            q.put(new_g + child_h, new_g, nodes.add(child, n, new_g, child_h, i))
+            timings['heuristic'] += middle - checked
+            timings['queue'] += time.perf_counter() - middle
+        generated += 1
+    return generated
+
+# The SolutionCache class remembers solutions between searches, so that boards that share part of their solution with an earlier one
+# can be solved without searching all of it again. It maps packed board states to the moves of an optimal solution from that state,
+# whose length is the state's exact distance to the goal. Packed states of different board sizes can never be equal, as a bigger
+# board always has a tile above the bits a smaller one uses, so one cache can hold every size. It takes the most states to keep
+# (max_size), with the least recently used ones dropped first once it is full, and optionally a file to keep them in between runs
+# (path), which is read if it exists. The lookup() function takes a packed state (state) and returns its moves, or None if it is not
+# cached. The record() function takes a board represented as a list (board), the moves of an optimal solution from it (moves) and the
+# board size (size), and caches every state along the solution with the rest of the moves from it. The save() function writes the
+# cache to its file, or to path if given, oldest entries first so loading it back keeps their order.
+class SolutionCache:
+    def __init__(self, max_size=1000000, path=None):
+        self.max_size = max_size
+        self.path = path
+        self.entries = OrderedDict()
+        if(path is not None and os.path.exists(path)):
+            with open(path) as f:
+                for state, moves in json.load(f)['entries']:
+                    self.entries[state] = moves
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def lookup(self, state):
+        moves = self.entries.get(state)
+        if(moves is not None):
+            self.entries.move_to_end(state)
+        return moves
+
+    def record(self, board, moves, size=3):
+        tables = get_tables(size)
+        steps = {'U': -size, 'D': size, 'L': -1, 'R': 1}
+        state = pack(board)
+        blank = find_blank(board)
+        for i in range(len(moves) + 1):
+            self.entries[state] = moves[i:]
+            self.entries.move_to_end(state)
+            if(i < len(moves)):
+                next_blank = blank + steps[moves[i]]
+                state = swap(state, blank, next_blank, tables.bits)
+                blank = next_blank
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def save(self, path=None):
+        if(path is None):
+            path = self.path
+        with open(path + '.tmp', 'w') as f:
+            json.dump({'entries': list(self.entries.items())}, f)
+        os.replace(path + '.tmp', path)
+
+    def __len__(self):
+        return len(self.entries)
+
+# The general_search() function takes an initial board (init_board), a trace flag represented as a char (trace), a search type
+# represented by a string (search) and the board size (size), and performs the search for the goal state. It is shared by the search
+# functions below, which only differ in the heuristic they pass in. Before any Node is created the board is run through is_solvable(),
+# and an unsolvable board returns right away. Passing check_solvable=False skips this check, so the search exhausts the reachable states
+# like it used to, which is useful for validating the check. The search gives up once it has expanded node_limit nodes or run for
+# time_limit seconds, if either is set. If the goal state is found, a success message is displayed along with the depth, expanded
+# nodes, frontier nodes, and the time taken. If no goal state is found, a failure message is displayed along with the expanded nodes and
+# time taken. If the trace flag is '1', the trace for the solution is displayed as well, unless an on_expand callback is given, which is
+# called instead. The python time library is used to display the system runtime. Passing verbose=False turns all of the displayed output
+# off. In every case the outcome is also returned as a SearchResult, including the moves of the solution. With profile=True the
+# SearchResult also gets the timings of the search's parts, measured with time.perf_counter(), and with track_memory=True its peak
+# memory. Both make the search slower, so they are off by default. If a SolutionCache is given (cache), every solution found is
+# recorded in it, and a Node whose state is cached is not expanded, as the cost of the best path through it is already known to be its
+# g(n) plus the length of the cached moves. The cheapest of these is kept, and as no path left on the queue can cost less than the
+# smallest f(n) on it, the search stops with that path as soon as the queue's smallest f(n) is no less than its cost.
+def general_search(init_board, trace, search, check_solvable=True, size=3, time_limit=None, node_limit=None, verbose=True, on_expand=None, profile=False, track_memory=False, cache=None):
+    if(len(init_board) != size * size):
+        raise ValueError('Board ' + str(init_board) + ' does not have ' + str(size * size) + ' tiles')
+    memory = MemoryTracker(track_memory)
     start_time = time.time()
+    tables = get_tables(size)
     expanded_nodes = 0
-    frontier_nodes = 0
+    generated_nodes = 0
+    if(on_expand is None and trace == '1'):
+        on_expand = trace_expansion
+    timings = None
+    if(profile):
+        timings = {'heuristic': 0.0, 'expansion': 0.0, 'queue': 0.0, 'duplicates': 0.0}
 
-    # This iterator from python's itertools library is used to assign a unique value to each tuple, as python's priority queue compares subsequent values 
-    # in tuples when prior values are equal, but I did not want to overload the '<' operator for my defined Node class. Since we can choose how to prioritize
-    # Nodes with the same priority, this method is used.
-    counter = itertools.count()
-    repeated_states = []
+    # The smallest g(n) every packed state has been reached with. Children that are no cheaper than this are dropped by expand(), so
+    # the queue only ever holds one entry per state and cost, and an entry whose g(n) has since been beaten is stale and skipped when
+    # it comes out. A dictionary makes both checks constant time lookups instead of scans through every reached board.
+    best_g = {}
     max_q_size = 0
-    print('Using initial board: ' + str(init_board))
+    if(verbose):
+        print('Using initial board: ' + str(init_board))
 
-    # initial node creation using uniform cost heuristic (hardcoded as 0)
-    n = Node(init_board, init_board, 0, get_h(init_board, 'uniform_cost'))
-    q = PriorityQueue()
+    # unsolvable boards are rejected before searching
+    if(check_solvable and not is_solvable(init_board)):
+        result = SearchResult('unsolvable', time=time.time() - start_time)
+        return finish_search(result, 0, memory, timings, verbose, size)
 
-    # This is how we assign unique integers to the tuple's second value.
-    q.put((n.get_g(), next(counter), n))
-    
-    while not q.empty():
-        # update the max queue size accordingly
-        if(q.qsize()>max_q_size):
-            max_q_size = q.qsize()
+    # initial node creation using the given heuristic; the queue holds the indices of Nodes in the NodeStore
+    nodes = NodeStore()
+    init_h = get_h(init_board, search, size)
+    n = nodes.add(pack(init_board), -1, 0, init_h, find_blank(init_board))
+    q = BucketQueue()
+    best_g[nodes.states[n]] = 0
+    q.put(init_h, 0, n)
 
-        # we dequeue the first value from our priority queue and set it equal to temp
-        temp = q.get()[2]
+    # the cheapest solution found through a cached state: its cost, the Node it went through and the cached moves from there
+    best = math.inf
+    best_node = None
+    best_moves = None
 
-        # we skip the expansion process if the board is repeated.
-        if(repeated(temp.get_board(),repeated_states)):
-            continue
+    result = None
+    try:
+        while not q.empty():
+            # no path left on the queue can beat the one through a cached state
+            if(best <= q.min_f()):
+                break
+
+            # update the max queue size accordingly
+            if(q.qsize()>max_q_size):
+                max_q_size = q.qsize()
+
+            # we dequeue the first value from our priority queue and set it equal to temp, and skip the expansion process if the
+            # board has since been reached at a lower cost.
+            if(profile):
+                start = time.perf_counter()
+                temp = q.get()
+                middle = time.perf_counter()
+                is_stale = nodes.g[temp] > best_g[nodes.states[temp]]
+                timings['queue'] += middle - start
+                timings['duplicates'] += time.perf_counter() - middle
+            else:
+                temp = q.get()
+                is_stale = nodes.g[temp] > best_g[nodes.states[temp]]
+            if(is_stale):
+                continue
+
+            # success state, all displayed values are appropriately calculated
+            if(nodes.states[temp] == tables.goal_state):
+                result = SearchResult('solved', nodes.g[temp], expanded_nodes, q.qsize(), max_q_size, time.time() - start_time, moves=nodes.get_moves(temp, size))
+                break
+
+            # the rest of a cached state's solution is already known, so it is not expanded
+            if(cache is not None):
+                moves = cache.lookup(nodes.states[temp])
+                if(moves is not None):
+                    if(nodes.g[temp] + len(moves) < best):
+                        best = nodes.g[temp] + len(moves)
+                        best_node = temp
+                        best_moves = moves
+                    continue
+
+            check_limits(expanded_nodes, node_limit, start_time, time_limit)
+
+            # trace check whether to output trace of expansion or not
+            if(on_expand is not None):
+                on_expand(nodes.states[temp], nodes.g[temp], nodes.h[temp], size)
+
+            # expansion of dequeued node using the given heuristic; the time expand() spends on duplicates, heuristics and the queue is
+            # already counted there, so only the rest of it counts as expansion
+            if(profile):
+                start = time.perf_counter()
+                before = timings['duplicates'] + timings['heuristic'] + timings['queue']
+                generated_nodes += expand(temp, nodes, q, best_g, search, size, timings)
+                timings['expansion'] += time.perf_counter() - start - (timings['duplicates'] + timings['heuristic'] + timings['queue'] - before)
+            else:
+                generated_nodes += expand(temp, nodes, q, best_g, search, size)
+            expanded_nodes += 1
+    except SearchLimit:
+        result = SearchResult('limit', None, expanded_nodes, q.qsize(), max_q_size, time.time() - start_time)
+
+    # the solution went through a cached state
+    if(result is None and best_node is not None):
+        result = SearchResult('solved', best, expanded_nodes, q.qsize(), max_q_size, time.time() - start_time, moves=nodes.get_moves(best_node, size) + best_moves)
 
-        # success state, all displayed values are appropriately calculated
-        if(temp.get_board() == [1,2,3,4,5,6,7,8,0]):
-            print('Final board: ' + str(temp.get_board()))
-            print('Success!')
-            print('Depth: ' + str(temp.get_g()))
-            print('Expanded Nodes: ' + str(expanded_nodes))
-            print('Frontier Nodes: ' + str(q.qsize()))
-            print('Max Queue Size: '+ str(max_q_size))
-            print("-- %s seconds -- were used." % (time.time() - start_time))
-            return
-
-        # trace check whether to output trace of expansion or not
-        if(trace == '1'):
-            print('The next state to expand has g(n) = ' + str(temp.get_g()) + ' and h(n) = ' + str(get_h(temp.get_board(), 'uniform_cost')) + ':')
-            print(temp.get_board())
-
-        # expansion of dequeued node using uniform cost heuristic
-        expand(temp, q, counter, 'uniform_cost')
-
-        # add this expanded node to repeated_states[]
-        repeated_states.append(temp.get_board())
-        expanded_nodes += 1
-    
     # failure state, our priority queue has nothing left to check
-    print('No solution exists!')
-    print('Expanded Nodes: ' + str(expanded_nodes))
-    print("-- %s seconds -- were used." % (time.time() - start_time))
+    if(result is None):
+        result = SearchResult('no_solution', None, expanded_nodes, 0, max_q_size, time.time() - start_time)
+    if(cache is not None and result.solved()):
+        cache.record(init_board, result.moves, size)
+    return finish_search(result, generated_nodes, memory, timings, verbose, size)
+
+# The uniform_cost_search() function takes an initial board (init_board) and a trace flag represented as a char (trace) and performs a uniform
+# cost search for the goal state, using the uniform cost heuristic (hardcoded as 0). It returns a SearchResult, check_solvable=False
+# turns off the up-front solvability check and size gives the board size (3 for the 8-puzzle, 4 for the 15-puzzle and so on). Any other
+# keyword options of general_search() (options), i.e. time_limit, node_limit, verbose, on_expand, profile, track_memory and cache, are
+# passed on to it, as they are by the search functions below.
+def uniform_cost_search(init_board, trace, check_solvable=True, size=3, **options):
+    return general_search(init_board, trace, 'uniform_cost', check_solvable, size, **options)
 
-# The misplaced_tile_search() function closely resembles our uniform_cost_search() function. The latter is documented, and as the algorithms are similar,
-# only major differences will be noted.
-def misplaced_tile_search(init_board, trace):
+# The misplaced_tile_search() function closely resembles our uniform_cost_search() function, using the misplaced tile heuristic instead.
+def misplaced_tile_search(init_board, trace, check_solvable=True, size=3, **options):
+    return general_search(init_board, trace, 'misplaced_tile', check_solvable, size, **options)
+
+# Again, the manhattan_search() function is similar to the previous two functions, using the manhattan heuristic to find the goal state.
+def manhattan_search(init_board, trace, check_solvable=True, size=3, **options):
+    return general_search(init_board, trace, 'manhattan', check_solvable, size, **options)
+
+# The linear_conflict_search() function is like manhattan_search(), using the manhattan distance plus linear conflicts as its heuristic.
+def linear_conflict_search(init_board, trace, check_solvable=True, size=3, **options):
+    return general_search(init_board, trace, 'linear_conflict', check_solvable, size, **options)
+
+# The pattern_database_search() function is like manhattan_search(), using the pattern database heuristic instead. The databases
+# for the board size have to be built with build_pdb.py first.
+def pattern_database_search(init_board, trace, check_solvable=True, size=3, **options):
+    return general_search(init_board, trace, 'pattern_database', check_solvable, size, **options)
+
+# The ida_star_visit() function is the depth-first part of IDA*. It takes the packed state being searched (state), the index of the blank
+# tile (blank), the index the blank was at before the last move (prev_blank), the current g(n) and h(n) values (g and h), the f(n)
+# threshold of the current iteration (threshold), a search type (search), the board size (size), the list of blank positions visited so
+# far (path), a two-item list counting the expanded and generated nodes over the whole search (counts), the on_expand callback or None
+# (on_expand) and a tuple of the search's node limit, start time and time limit (limits), which are passed to check_limits(). Each
+# child's h(n) value is updated from its parent's with get_child_h(), and only the current path is ever kept in memory. It returns -1 if
+# the goal state was found, in which case path is left at the solution, and otherwise the smallest f(n) value that went over the
+# threshold, which becomes the threshold of the next iteration.
+def ida_star_visit(state, blank, prev_blank, g, h, threshold, search, size, path, counts, on_expand, limits):
+    f = g + h
+    if(f > threshold):
+        return f
+    tables = get_tables(size)
+    if(state == tables.goal_state):
+        return -1
+    check_limits(counts[0], limits[0], limits[1], limits[2])
+    if(on_expand is not None):
+        on_expand(state, g, h, size)
+    counts[0] += 1
+    minimum = math.inf
+    for i in tables.neighbours[blank]:
+        # moving the blank straight back would only undo the last move
+        if(i == prev_blank):
+            continue
+        child = swap(state, blank, i, tables.bits)
+        counts[1] += 1
+        path.append(i)
+        t = ida_star_visit(child, i, blank, g + 1, get_child_h(h, state, child, blank, i, search, size), threshold, search, size, path, counts, on_expand, limits)
+        if(t == -1):
+            return -1
+        path.pop()
+        if(t < minimum):
+            minimum = t
+    return minimum
+
+# The ida_star_search() function takes an initial board (init_board), a trace flag represented as a char (trace), the board size (size)
+# and a search type (search, 'manhattan' by default) and performs an iterative deepening A* search for the goal state. Instead of keeping
+# every generated Node in a priority queue, each iteration runs a depth-first search that cuts off any path whose g(n) + h(n) goes over
+# the threshold, starting with the h(n) value of the initial board and raising it to the smallest f(n) value that went over it. Memory
+# use only grows with the length of the current path, which lets it solve 15-puzzle instances the other searches run out of memory on.
+# The threshold and the number of expanded nodes are displayed after every iteration and are also kept in the returned SearchResult.
+# The solvability check is always run first, as without a closed set the search would never finish on an unsolvable board. The
+# time_limit, node_limit, verbose, on_expand and track_memory options work the same way as in general_search(), with node_limit
+# counting the expanded nodes of every iteration together.
+def ida_star_search(init_board, trace, size=3, search='manhattan', time_limit=None, node_limit=None, verbose=True, on_expand=None, track_memory=False):
+    if(len(init_board) != size * size):
+        raise ValueError('Board ' + str(init_board) + ' does not have ' + str(size * size) + ' tiles')
+    memory = MemoryTracker(track_memory)
     start_time = time.time()
+    if(on_expand is None and trace == '1'):
+        on_expand = trace_expansion
+    if(verbose):
+        print('Using initial board: ' + str(init_board))
+    if(not is_solvable(init_board)):
+        result = SearchResult('unsolvable', time=time.time() - start_time)
+        return finish_search(result, 0, memory, None, verbose, size)
+
+    state = pack(init_board)
+    blank = find_blank(init_board)
+    h = get_h(init_board, search, size)
+    threshold = h
     expanded_nodes = 0
-    frontier_nodes = 0
-    counter = itertools.count()
-    repeated_states = []
-    max_q_size = 0
-    print('Using initial board: ' + str(init_board))
-
-    # initial node creation with misplaced tile heuristic
-    n = Node(init_board, init_board, 0, get_h(init_board, 'misplaced_tile'))
-    q = PriorityQueue()
-    q.put((n.get_g() + get_h(n.get_board(), 'misplaced_tile'), next(counter), n))
-    
-    while not q.empty():
-        if(q.qsize()>max_q_size):
-            max_q_size = q.qsize()
-        temp = q.get()[2]
-        if(repeated(temp.get_board(),repeated_states)):
-            continue
-        if(temp.get_board() == [1,2,3,4,5,6,7,8,0]):
-            print('Final board: ' + str(temp.get_board()))
-            print('Success!')
-            print('Depth: ' + str(temp.get_g()))
-            print('Expanded Nodes: ' + str(expanded_nodes))
-            print('Frontier Nodes: ' + str(q.qsize()))
-            print('Max Queue Size: '+ str(max_q_size))
-            print("-- %s seconds -- were used." % (time.time() - start_time))
-            return
-        if(trace == '1'):
-            print('The next state to expand has g(n) = ' + str(temp.get_g()) + ' and h(n) = ' + str(get_h(temp.get_board(), 'misplaced_tile')) + ':')
-            print(temp.get_board())
-
-        # expansion of dequeued node using misplaced tile heuristic
-        expand(temp, q, counter, 'misplaced_tile')
-        repeated_states.append(temp.get_board())
-        expanded_nodes += 1
-    print('No solution exists!')
-    print('Expanded Nodes: ' + str(expanded_nodes))
-    print("-- %s seconds -- were used." % (time.time() - start_time))
+    iterations = []
+    path = [blank]
+    limits = (node_limit, start_time, time_limit)
+    # counts keeps counting across iterations so the node limit applies to the whole search
+    counts = [0, 0]
+    while True:
+        try:
+            t = ida_star_visit(state, blank, -1, 0, h, threshold, search, size, path, counts, on_expand, limits)
+        except SearchLimit:
+            iterations.append((threshold, counts[0] - expanded_nodes))
+            result = SearchResult('limit', None, counts[0], 0, 0, time.time() - start_time, iterations)
+            break
+        iterations.append((threshold, counts[0] - expanded_nodes))
+        expanded_nodes = counts[0]
+        if(verbose):
+            print('Threshold: ' + str(threshold) + ', Expanded Nodes: ' + str(iterations[-1][1]))
+        if(t == -1):
+            result = SearchResult('solved', len(path) - 1, expanded_nodes, 0, 0, time.time() - start_time, iterations, move_names(path, size))
+            break
+        threshold = t
+    return finish_search(result, counts[1], memory, None, verbose, size)
 
-# Again, the manhattan_search() function is similar to the previous two functions, using the manhattan heuristic to find the goal state.
-def manhattan_search(init_board, trace):
+# The bidirectional searches below search forward from the initial board and backward from the goal at the same time, so each half only
+# has to reach about half the solution depth. Each half keeps a dictionary (parents) from every state it has reached to the state it was
+# reached from and the slot of the blank, which doubles as its hashed set of visited states. The bidirectional_moves() function takes
+# the state where the two halves met (meet), the forward and backward dictionaries (forward and backward) and the board size (size), and
+# returns the moves of the whole solution from the initial board through meet to the goal.
+def bidirectional_moves(meet, forward, backward, size=3):
+    blanks = []
+    state = meet
+    while state is not None:
+        parent, blank = forward[state]
+        blanks.append(blank)
+        state = parent
+    blanks.reverse()
+    state = backward[meet][0]
+    while state is not None:
+        parent, blank = backward[state]
+        blanks.append(blank)
+        state = parent
+    return move_names(blanks, size)
+
+# The bidirectional_depth() function takes a state (state) and a bidirectional search dictionary (parents) and returns how many moves
+# the state is from the start of that half, by following its parents.
+def bidirectional_depth(state, parents):
+    depth = 0
+    state = parents[state][0]
+    while state is not None:
+        depth += 1
+        state = parents[state][0]
+    return depth
+
+# The bidirectional_search() function takes an initial board (init_board) and a trace flag represented as a char (trace) and performs a
+# blind bidirectional search, a breadth-first search from each end. Every round expands one whole layer of the half with the smaller
+# frontier, and each new state is looked up in the other half's dictionary. Once a layer has produced any meeting, the shortest path
+# through the meetings of that layer is optimal, as every state of a shorter path would already have been seen by both halves and
+# caught in an earlier layer. The frontier is the sum of both halves' current layers. The check_solvable, size, time_limit, node_limit,
+# verbose, on_expand and track_memory options work the same way as in general_search(), with on_expand getting an h(n) value of 0.
+def bidirectional_search(init_board, trace, check_solvable=True, size=3, time_limit=None, node_limit=None, verbose=True, on_expand=None, track_memory=False):
+    if(len(init_board) != size * size):
+        raise ValueError('Board ' + str(init_board) + ' does not have ' + str(size * size) + ' tiles')
+    memory = MemoryTracker(track_memory)
     start_time = time.time()
+    tables = get_tables(size)
+    if(on_expand is None and trace == '1'):
+        on_expand = trace_expansion
+    if(verbose):
+        print('Using initial board: ' + str(init_board))
+    if(check_solvable and not is_solvable(init_board)):
+        result = SearchResult('unsolvable', time=time.time() - start_time)
+        return finish_search(result, 0, memory, None, verbose, size)
+
+    init_state = pack(init_board)
+    # Each half has its dictionary of reached states, the depth of its current layer and the layer itself as (state, blank) pairs.
+    forward = {init_state: (None, find_blank(init_board))}
+    backward = {tables.goal_state: (None, tables.cells - 1)}
+    depths = [0, 0]
+    layers = [[(init_state, forward[init_state][1])], [(tables.goal_state, tables.cells - 1)]]
+    halves = [(forward, backward), (backward, forward)]
     expanded_nodes = 0
-    frontier_nodes = 0
-    counter = itertools.count()
-    repeated_states = []
-    max_q_size = 0
-    print('Using initial board: ' + str(init_board))
-
-    # initial node creation using manhattan heuristic
-    n = Node(init_board, init_board, 0, get_h(init_board, 'manhattan'))
-    q = PriorityQueue()
-    q.put((n.get_g() + get_h(n.get_board(), 'manhattan'), next(counter), n))
-    
-    while not q.empty():
-        if(q.qsize()>max_q_size):
-            max_q_size = q.qsize()
-        temp = q.get()[2]
-        if(repeated(temp.get_board(),repeated_states)):
-            continue
-        if(temp.get_board() == [1,2,3,4,5,6,7,8,0]):
-            print('Final board: ' + str(temp.get_board()))
-            print('Success!')
-            print('Depth: ' + str(temp.get_g()))
-            print('Expanded Nodes: ' + str(expanded_nodes))
-            print('Frontier Nodes: ' + str(q.qsize()))
-            print('Max Queue Size: '+ str(max_q_size))
-            print("-- %s seconds -- were used." % (time.time() - start_time))
-            return
-        if(trace == '1'):
-            print('The next state to expand has g(n) = ' + str(temp.get_g()) + ' and h(n) = ' + str(get_h(temp.get_board(), 'manhattan')) + ':')
-            print(temp.get_board())
-
-        # expansion of dequeued node using manhattan heuristic
-        expand(temp, q, counter, 'manhattan')
-        repeated_states.append(temp.get_board())
-        expanded_nodes += 1
-    print('No solution exists!')
-    print('Expanded Nodes: ' + str(expanded_nodes))
-    print("-- %s seconds -- were used." % (time.time() - start_time))
+    generated_nodes = 0
+    max_q_size = 2
+    best = math.inf
+    meet = init_state if init_state == tables.goal_state else None
+    if(meet is not None):
+        best = 0
+
+    result = None
+    try:
+        while meet is None and layers[0] and layers[1]:
+            side = 0 if len(layers[0]) <= len(layers[1]) else 1
+            mine, other = halves[side]
+            next_layer = []
+            for state, blank in layers[side]:
+                check_limits(expanded_nodes, node_limit, start_time, time_limit)
+                if(on_expand is not None):
+                    on_expand(state, depths[side], 0, size)
+                for i in tables.neighbours[blank]:
+                    child = swap(state, blank, i, tables.bits)
+                    if(child in mine):
+                        continue
+                    generated_nodes += 1
+                    mine[child] = (state, i)
+                    next_layer.append((child, i))
+                    if(child in other):
+                        # the backward depth of a state is not stored, so it is counted along its parents
+                        cost = depths[side] + 1 + bidirectional_depth(child, other)
+                        if(cost < best):
+                            best = cost
+                            meet = child
+                expanded_nodes += 1
+            layers[side] = next_layer
+            depths[side] += 1
+            if(len(layers[0]) + len(layers[1]) > max_q_size):
+                max_q_size = len(layers[0]) + len(layers[1])
+    except SearchLimit:
+        result = SearchResult('limit', None, expanded_nodes, len(layers[0]) + len(layers[1]), max_q_size, time.time() - start_time)
+
+    if(result is None):
+        if(meet is not None):
+            result = SearchResult('solved', best, expanded_nodes, len(layers[0]) + len(layers[1]), max_q_size, time.time() - start_time, moves=bidirectional_moves(meet, forward, backward, size))
+        else:
+            result = SearchResult('no_solution', None, expanded_nodes, 0, max_q_size, time.time() - start_time)
+    return finish_search(result, generated_nodes, memory, None, verbose, size)
+
+# The bidirectional_astar_search() function takes an initial board (init_board), a trace flag represented as a char (trace) and a search
+# type (search, 'manhattan' by default) and performs a front-to-end bidirectional A* search. The forward half measures its heuristic
+# towards the goal and the backward half measures it towards the initial board, using a BoardTables built for that board. Each half has
+# its own priority queue, dictionary of best g(n) values and closed set, and the half with the smaller queue is expanded next. Whenever a
+# state is reached that the other half has also reached, the cost of the path through it is a candidate solution. Any shorter path still
+# to be found has to pass through a Node on each queue, so it costs at least the smallest f(n) on either queue, and the search stops once
+# the best candidate is no more than the larger of the two. The heuristics have to be consistent for this, so pattern_database is not
+# supported. The check_solvable, size, time_limit, node_limit, verbose, on_expand and track_memory options work the same way as in
+# general_search().
+def bidirectional_astar_search(init_board, trace, search='manhattan', check_solvable=True, size=3, time_limit=None, node_limit=None, verbose=True, on_expand=None, track_memory=False):
+    if(len(init_board) != size * size):
+        raise ValueError('Board ' + str(init_board) + ' does not have ' + str(size * size) + ' tiles')
+    if(search == 'pattern_database'):
+        raise ValueError('The pattern_database heuristic cannot be measured towards the initial board')
+    memory = MemoryTracker(track_memory)
+    start_time = time.time()
+    tables = get_tables(size)
+    if(on_expand is None and trace == '1'):
+        on_expand = trace_expansion
+    if(verbose):
+        print('Using initial board: ' + str(init_board))
+    if(check_solvable and not is_solvable(init_board)):
+        result = SearchResult('unsolvable', time=time.time() - start_time)
+        return finish_search(result, 0, memory, None, verbose, size)
+
+    init_state = pack(init_board)
+    init_blank = find_blank(init_board)
+    # Everything the two halves keep is in lists indexed by 0 for forward and 1 for backward.
+    heuristic_tables = [tables, BoardTables(size, init_board)]
+    parents = [{init_state: (None, init_blank)}, {tables.goal_state: (None, tables.cells - 1)}]
+    best_g = [{init_state: 0}, {tables.goal_state: 0}]
+    closed = [set(), set()]
+    queues = [BucketQueue(), BucketQueue()]
+    init_h = get_h(init_board, search, size)
+    queues[0].put(init_h, 0, (init_state, 0, init_h, init_blank))
+    queues[1].put(init_h, 0, (tables.goal_state, 0, init_h, tables.cells - 1))
+    expanded_nodes = 0
+    generated_nodes = 0
+    max_q_size = 2
+    best = 0 if init_state == tables.goal_state else math.inf
+    meet = init_state if init_state == tables.goal_state else None
+
+    result = None
+    try:
+        while not queues[0].empty() and not queues[1].empty():
+            if(queues[0].qsize() + queues[1].qsize() > max_q_size):
+                max_q_size = queues[0].qsize() + queues[1].qsize()
+
+            if(best <= max(queues[0].min_f(), queues[1].min_f())):
+                break
+            side = 0 if queues[0].qsize() <= queues[1].qsize() else 1
+            state, g, h, blank = queues[side].get()
+            if(state in closed[side] or g > best_g[side][state]):
+                continue
+            check_limits(expanded_nodes, node_limit, start_time, time_limit)
+            if(on_expand is not None):
+                on_expand(state, g, h, size)
+            closed[side].add(state)
+            expanded_nodes += 1
+
+            other = 1 - side
+            new_g = g + 1
+            for i in tables.neighbours[blank]:
+                child = swap(state, blank, i, tables.bits)
+                if(child in closed[side] or new_g >= best_g[side].get(child, math.inf)):
+                    continue
+                best_g[side][child] = new_g
+                parents[side][child] = (state, i)
+                child_h = get_child_h(h, state, child, blank, i, search, size, heuristic_tables[side])
+                queues[side].put(new_g + child_h, new_g, (child, new_g, child_h, i))
+                generated_nodes += 1
+                if(child in best_g[other] and new_g + best_g[other][child] < best):
+                    best = new_g + best_g[other][child]
+                    meet = child
+    except SearchLimit:
+        result = SearchResult('limit', None, expanded_nodes, queues[0].qsize() + queues[1].qsize(), max_q_size, time.time() - start_time)
+
+    if(result is None):
+        if(meet is not None):
+            result = SearchResult('solved', best, expanded_nodes, queues[0].qsize() + queues[1].qsize(), max_q_size, time.time() - start_time, moves=bidirectional_moves(meet, parents[0], parents[1], size))
+        else:
+            result = SearchResult('no_solution', None, expanded_nodes, 0, max_q_size, time.time() - start_time)
+    return finish_search(result, generated_nodes, memory, None, verbose, size)
+
+# The 8-puzzle only has 181,440 reachable states, so instead of searching, the optimal distance of every state can be worked out once
+# and stored in a table with one byte per state. States are indexed by the rank of the board as a permutation, which is pattern_rank()
+# with the board's tiles in place of slots, so the 9! = 362,880 possible boards each get their own byte and the half that cannot reach
+# the goal are left at 255. DISTANCE_TABLE_FILE is where the table is kept, next to the pattern databases.
+DISTANCE_TABLE_FILE = os.path.join(PDB_DIRECTORY, '3x3-distances.bin')
+
+# The build_distance_table() function runs a breadth-first search backwards from [1,2,3,4,5,6,7,8,0] over every reachable 8-puzzle
+# state and returns the table of distances as a bytearray. As every move can be undone, the number of moves from the goal to a state is
+# also the number of moves from that state to the goal. This is meant to be run offline through build_pdb.py and takes a few seconds.
+def build_distance_table():
+    tables = get_tables(3)
+    unseen = 255
+    table = bytearray([unseen]) * math.factorial(tables.cells)
+    table[pattern_rank(tables.goal_board, tables.cells)] = 0
+    q = deque([(tables.goal_state, tables.cells - 1, 0)])
+    while q:
+        state, blank, distance = q.popleft()
+        for i in tables.neighbours[blank]:
+            child = swap(state, blank, i, tables.bits)
+            rank = pattern_rank(unpack(child), tables.cells)
+            if(table[rank] == unseen):
+                table[rank] = distance + 1
+                q.append((child, i, distance + 1))
+    return table
+
+# The distance table file starts with the 4 bytes DST1 followed by the table. The save_distance_table() function takes the table (table)
+# and a path (path, DISTANCE_TABLE_FILE by default), writes the file and returns its path.
+def save_distance_table(table, path=None):
+    if(path is None):
+        path = DISTANCE_TABLE_FILE
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b'DST1')
+        f.write(table)
+    return path
+
+# The DistanceTable class is a distance table file that has been memory-mapped the same way as a PatternDatabase. The lookup() function
+# takes a board represented as a list (board) and returns its optimal distance to the goal, or None if the board cannot reach it.
+class DistanceTable:
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if(self.data[:4] != b'DST1'):
+            raise ValueError(path + ' is not a distance table file')
+
+    def lookup(self, board):
+        distance = self.data[4 + pattern_rank(board, 9)]
+        if(distance == 255):
+            return None
+        return distance
+
+# The loaded table is kept in distance_tables by path so the file is only mapped once per process. The load_distance_table() function
+# takes a path (path, DISTANCE_TABLE_FILE by default) and returns its DistanceTable.
+distance_tables = {}
+
+def load_distance_table(path=None):
+    if(path is None):
+        path = DISTANCE_TABLE_FILE
+    if(path not in distance_tables):
+        if(not os.path.exists(path)):
+            raise FileNotFoundError('No distance table at ' + path + ', build it with: python build_pdb.py --distance-table')
+        distance_tables[path] = DistanceTable(path)
+    return distance_tables[path]
+
+# The distance_table_search() function takes an initial 8-puzzle board (init_board) and a trace flag represented as a char (trace), and
+# solves it with the distance table instead of searching. The optimal depth is a single lookup, and the solution is found by always
+# moving to a neighbouring board whose distance is one less, which has to exist for every board but the goal, so it takes exactly depth
+# steps no matter how hard the board is. Each of those steps counts as an expanded node in the returned SearchResult. The path option
+# picks the table file, and the verbose, on_expand and track_memory options work the same way as in general_search().
+def distance_table_search(init_board, trace, path=None, verbose=True, on_expand=None, track_memory=False):
+    if(len(init_board) != 9):
+        raise ValueError('The distance table only covers the 8-puzzle, not ' + str(init_board))
+    memory = MemoryTracker(track_memory)
+    start_time = time.time()
+    if(on_expand is None and trace == '1'):
+        on_expand = trace_expansion
+    if(verbose):
+        print('Using initial board: ' + str(init_board))
+    distances = load_distance_table(path)
+    depth = distances.lookup(init_board)
+    if(depth is None):
+        result = SearchResult('unsolvable', time=time.time() - start_time)
+        return finish_search(result, 0, memory, None, verbose)
+
+    tables = get_tables(3)
+    board = list(init_board)
+    blank = find_blank(board)
+    blanks = [blank]
+    generated_nodes = 0
+    for distance in range(depth, 0, -1):
+        if(on_expand is not None):
+            on_expand(pack(board), depth - distance, distance, 3)
+        for i in tables.neighbours[blank]:
+            generated_nodes += 1
+            board[blank], board[i] = board[i], board[blank]
+            if(distances.lookup(board) == distance - 1):
+                blank = i
+                break
+            board[blank], board[i] = board[i], board[blank]
+        blanks.append(blank)
+    result = SearchResult('solved', depth, depth, 0, 0, time.time() - start_time, moves=move_names(blanks))
+    return finish_search(result, generated_nodes, memory, None, verbose)
+
+# Hash-distributed A* (HDA*) runs one A* search across several worker processes, so a single hard board can use every core. Each
+# worker owns the states that hash_owner() maps to it and keeps its own BucketQueue and dictionary of best g(n) values for them, and a
+# worker that generates a child it does not own sends it to the owner instead. Children are collected into batches of up to batch_size
+# per owner before being sent, as every message costs far more than expanding a Node. A worker also sends the batches it has after every
+# few expansions and whenever it runs out of work, as a Node held back can leave its owner idle or expanding Nodes that turn out to
+# cost more than the solution. HASH_MULTIPLIER spreads packed states that differ in only a few tiles evenly over the workers, so they
+# all get a similar share of the work.
+HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+
+# The hash_owner() function takes a packed state (state) and the number of workers (workers) and returns the index of the worker that
+# owns the state.
+def hash_owner(state, workers):
+    return (((state * HASH_MULTIPLIER) & 0xFFFFFFFFFFFFFFFF) >> 32) % workers
+
+# As the Nodes of a path are spread over different workers, there are no parent Nodes to follow back. Instead each Node carries the
+# moves made to reach it packed into an integer with two bits per move, in the order of MOVE_CODES. The hda_star_moves() function takes
+# such an integer (path) and the number of moves in it (g) and returns the moves as a string.
+MOVE_CODES = 'UDLR'
+
+def hda_star_moves(path, g):
+    moves = []
+    for _ in range(g):
+        moves.append(MOVE_CODES[path & 3])
+        path >>= 2
+    moves.reverse()
+    return ''.join(moves)
+
+# The hda_star_worker() function is run by each worker process of hda_star_search(). It takes the worker's index (index), a search type
+# (search), the board size (size), the trace flag (trace), the list of every worker's queue of incoming batches (inboxes), the queue
+# results are sent back to the parent on (results), the shared cost of the best solution found so far (incumbent), the event the
+# parent sets to stop the workers (stop), shared arrays with a slot per worker for its idle flag (idle), the number of Nodes it has
+# sent (sent), received (received) and expanded (expanded), the most Nodes to send in one batch (batch_size) and the number of
+# expansions after which the batches are sent anyway (flush_every). A Node is sent as a tuple of its packed
+# state, g(n), h(n), blank position and packed moves. Nodes whose f(n) is not below the incumbent can not lead to a better solution and
+# are dropped, and when a worker pops the goal state it lowers the incumbent and sends the solution to the parent. A worker is idle once
+# its queue is empty or holds nothing below the incumbent, and it only says so after flushing every batch it has been building, so
+# that every Node it generated is counted in sent before it looks idle. Once stopped it sends ('done', index, expanded nodes, generated
+# nodes, max queue size, queue size) to the parent, and if anything goes wrong, e.g. a pattern database is missing, it sends ('error',
+# index, exception) instead so the parent can stop the search and raise it.
+def hda_star_worker(index, search, size, trace, inboxes, results, incumbent, stop, idle, sent, received, expanded, batch_size, flush_every):
+    try:
+        tables = get_tables(size)
+        workers = len(inboxes)
+        inbox = inboxes[index]
+        # Batches left in the queues once the search stops are never read, and must not keep this process from exiting.
+        for q in inboxes:
+            q.cancel_join_thread()
+        codes = {-size: 0, size: 1, -1: 2, 1: 3}
+        open_list = BucketQueue()
+        best_g = {}
+        outgoing = [[] for _ in range(workers)]
+        expansions = 0
+        generated = 0
+        max_open = 0
+
+        # Adds a Node this worker owns to its queue, unless it was already reached at the same or a lower cost. Like expand(), only the
+        # Nodes that get added count as generated.
+        def add(node, bound):
+            nonlocal generated
+            state, g, h = node[0], node[1], node[2]
+            old_g = best_g.get(state)
+            if((old_g is None or g < old_g) and g + h < bound):
+                best_g[state] = g
+                open_list.put(g + h, g, node)
+                generated += 1
+
+        def receive(batch, bound):
+            for node in batch:
+                add(node, bound)
+            received[index] += len(batch)
+
+        def flush():
+            for owner in range(workers):
+                if(outgoing[owner]):
+                    sent[index] += len(outgoing[owner])
+                    inboxes[owner].put(outgoing[owner])
+                    outgoing[owner] = []
+
+        while not stop.is_set():
+            bound = incumbent.value
+            while True:
+                try:
+                    batch = inbox.get_nowait()
+                except Empty:
+                    break
+                idle[index] = 0
+                receive(batch, bound)
+            if(open_list.qsize() > max_open):
+                max_open = open_list.qsize()
+
+            # with nothing left to expand, wait for more Nodes to arrive
+            if(open_list.empty() or open_list.min_f() >= bound):
+                flush()
+                idle[index] = 1
+                try:
+                    batch = inbox.get(timeout=0.01)
+                except Empty:
+                    continue
+                idle[index] = 0
+                receive(batch, incumbent.value)
+                continue
+
+            for _ in range(flush_every):
+                if(open_list.empty() or open_list.min_f() >= bound):
+                    break
+                state, g, h, blank, path = open_list.get()
+                if(g > best_g[state]):
+                    continue
+                if(state == tables.goal_state):
+                    with incumbent.get_lock():
+                        if(g < incumbent.value):
+                            incumbent.value = g
+                            results.put(('solution', g, path))
+                    bound = incumbent.value
+                    continue
+                if(trace == '1'):
+                    trace_expansion(state, g, h, size)
+                expansions += 1
+                new_g = g + 1
+                for i in tables.neighbours[blank]:
+                    child = swap(state, blank, i, tables.bits)
+                    child_h = get_child_h(h, state, child, blank, i, search, size)
+                    if(new_g + child_h >= bound):
+                        continue
+                    node = (child, new_g, child_h, i, path * 4 + codes[i - blank])
+                    owner = hash_owner(child, workers)
+                    if(owner == index):
+                        add(node, bound)
+                    else:
+                        outgoing[owner].append(node)
+                        if(len(outgoing[owner]) >= batch_size):
+                            sent[index] += len(outgoing[owner])
+                            inboxes[owner].put(outgoing[owner])
+                            outgoing[owner] = []
+            expanded[index] = expansions
+            flush()
+        results.put(('done', index, expansions, generated, max_open, open_list.qsize()))
+    except Exception as e:
+        results.put(('error', index, e))
+
+# The hda_star_search() function takes an initial board (init_board), a trace flag represented as a char (trace), a search type
+# represented by a string (search, any heuristic get_h() supports) and the number of worker processes (workers, one per core by
+# default), and performs a hash-distributed A* search for the goal state with batches of up to batch_size Nodes, which each worker
+# sends off after every flush_every expansions. The parent process only hands the initial Node to its owner, collects solutions and
+# decides when the search is over. It is over when every worker is idle and every Node sent has been received, as then no worker has a
+# Node left whose f(n) is below the incumbent, and with an admissible heuristic no such Node means no cheaper solution exists. As the
+# workers change the flags and counters while they are being read, they are read twice a moment apart and the search only stops if
+# both readings agree. Solutions may be found out of order, but the search always runs until this holds, so the solution returned is
+# optimal. The SearchResult holds the expanded and generated Nodes of every worker together, counted the same way as general_search()
+# counts them, and the expanded Nodes of each worker in worker_expanded. Its max_q_size is the sum of each worker's largest queue size,
+# which the workers may have reached at different times, so it is an upper bound on the most Nodes ever queued at once. The
+# check_solvable, size, time_limit, node_limit and verbose options work the same way as in general_search(), with the limits checked
+# by the parent between readings. If the trace flag is '1', every worker displays the Nodes it expands, mixed together in the order
+# they happen. If a worker fails, the other workers are stopped and the worker's exception is raised, or a RuntimeError if the worker
+# died without sending one.
+def hda_star_search(init_board, trace, search='manhattan', workers=None, check_solvable=True, size=3, time_limit=None, node_limit=None, verbose=True, batch_size=64, flush_every=4):
+    if(len(init_board) != size * size):
+        raise ValueError('Board ' + str(init_board) + ' does not have ' + str(size * size) + ' tiles')
+    start_time = time.time()
+    tables = get_tables(size)
+    if(workers is None):
+        workers = os.cpu_count() or 1
+    memory = MemoryTracker(False)
+    if(verbose):
+        print('Using initial board: ' + str(init_board))
+    if(check_solvable and not is_solvable(init_board)):
+        result = SearchResult('unsolvable', time=time.time() - start_time)
+        return finish_search(result, 0, memory, None, verbose, size)
+    init_state = pack(init_board)
+    if(init_state == tables.goal_state):
+        result = SearchResult('solved', 0, 0, 0, 1, time.time() - start_time, moves='', worker_expanded=[0] * workers)
+        return finish_search(result, 0, memory, None, verbose, size)
+
+    context = multiprocessing.get_context()
+    inboxes = [context.Queue() for _ in range(workers)]
+    results = context.Queue()
+    incumbent = context.Value('i', 2 ** 31 - 1)
+    stop = context.Event()
+    idle = context.Array('b', workers, lock=False)
+    sent = context.Array('q', workers, lock=False)
+    received = context.Array('q', workers, lock=False)
+    expanded = context.Array('q', workers, lock=False)
+    init_node = (init_state, 0, get_h(init_board, search, size), find_blank(init_board), 0)
+    processes = []
+    for index in range(workers):
+        process = context.Process(target=hda_star_worker, args=(index, search, size, trace, inboxes, results, incumbent, stop, idle, sent, received, expanded, batch_size, flush_every))
+        process.start()
+        processes.append(process)
+    inboxes[hash_owner(init_state, workers)].put([init_node])
+
+    # the initial Node is counted as sent by the parent
+    def reading():
+        return list(idle), sum(sent) + 1, sum(received)
+
+    status = None
+    solution = None
+    stats = {}
+    errors = []
+
+    # Takes in a message from a worker: a solution, the worker's final statistics or the exception it failed with.
+    def handle(message):
+        nonlocal solution
+        if(message[0] == 'solution'):
+            if(solution is None or message[1] < solution[0]):
+                solution = (message[1], message[2])
+        elif(message[0] == 'error'):
+            stats[message[1]] = None
+            errors.append(message[2])
+        else:
+            stats[message[1]] = message[2:]
+
+    def drain():
+        while True:
+            try:
+                handle(results.get_nowait())
+            except Empty:
+                return
+
+    # Workers that have exited without sending their final statistics or an exception, e.g. because they were killed.
+    def lost_workers():
+        return [i for i in range(workers) if i not in stats and processes[i].exitcode is not None]
+
+    try:
+        while status is None:
+            # a worker only exits before it is stopped if it failed, and then the search can not finish
+            drain()
+            if(lost_workers()):
+                drain()
+                for i in lost_workers():
+                    errors.append(RuntimeError('HDA* worker ' + str(i) + ' stopped with exit code ' + str(processes[i].exitcode)))
+            if(errors):
+                break
+            if((node_limit is not None and sum(expanded) >= node_limit) or (time_limit is not None and time.time() - start_time >= time_limit)):
+                status = 'limit'
+                break
+            first = reading()
+            time.sleep(0.002)
+            second = reading()
+            if(first == second and all(first[0]) and first[1] == first[2]):
+                status = 'done'
+    finally:
+        stop.set()
+        while len(stats) < workers:
+            try:
+                handle(results.get(timeout=0.1))
+            except Empty:
+                if(len(lost_workers()) == workers - len(stats)):
+                    drain()
+                    for i in lost_workers():
+                        errors.append(RuntimeError('HDA* worker ' + str(i) + ' stopped with exit code ' + str(processes[i].exitcode)))
+                    break
+        for process in processes:
+            process.join(1)
+            if(process.is_alive()):
+                process.terminate()
+                process.join()
+    if(errors):
+        raise errors[0]
+
+    worker_expanded = [stats[i][0] for i in range(workers)]
+    # the initial Node was added by its owner but is not anyone's child
+    generated_nodes = sum(stats[i][1] for i in range(workers)) - 1
+    max_q_size = sum(stats[i][2] for i in range(workers))
+    frontier_nodes = sum(stats[i][3] for i in range(workers))
+    elapsed = time.time() - start_time
+    if(status == 'limit'):
+        result = SearchResult('limit', None, sum(worker_expanded), frontier_nodes, max_q_size, elapsed, worker_expanded=worker_expanded)
+    elif(solution is not None):
+        result = SearchResult('solved', solution[0], sum(worker_expanded), frontier_nodes, max_q_size, elapsed, moves=hda_star_moves(solution[1], solution[0]), worker_expanded=worker_expanded)
+    else:
+        result = SearchResult('no_solution', None, sum(worker_expanded), 0, max_q_size, elapsed, worker_expanded=worker_expanded)
+    return finish_search(result, generated_nodes, memory, None, verbose, size)
+
+# ALGORITHMS lists the names run_algorithm() accepts. The first five are run through general_search() with the same name as the search
+# type, and the rest through their own search functions.
+ALGORITHMS = ['uniform_cost', 'misplaced_tile', 'manhattan', 'linear_conflict', 'pattern_database', 'ida_star', 'distance_table', 'bidirectional', 'bidirectional_astar', 'hda_star']
+
+# The run_algorithm() function runs any of the searches by name without displaying anything, for tools like batch.py and benchmark.py.
+# It takes a board represented as a list (board), the name of the algorithm (algorithm), the heuristic used by ida_star,
+# bidirectional_astar and hda_star (heuristic), the board size (size, worked out from the board if not given), the time and node limits
+# (time_limit and node_limit), the on_expand, profile and track_memory options of general_search(), an optional SolutionCache (cache)
+# and the number of worker processes hda_star uses (workers), and returns the search's SearchResult. profile only applies to the
+# general_search() algorithms, which also use the cache during the search, and hda_star ignores on_expand and track_memory as its
+# Nodes are expanded in other processes. The other algorithms only use the cache in front of the search, returning a cached board's
+# solution without searching, and record the solutions they find in it.
+def run_algorithm(board, algorithm, heuristic='manhattan', size=None, time_limit=None, node_limit=None, on_expand=None, profile=False, track_memory=False, cache=None, workers=None):
+    if(size is None):
+        size = math.isqrt(len(board))
+    if(algorithm in ALGORITHMS[:5]):
+        return general_search(board, '2', algorithm, True, size, time_limit, node_limit, False, on_expand, profile, track_memory, cache)
+    if(algorithm not in ALGORITHMS):
+        raise ValueError('Unknown algorithm ' + algorithm)
+    if(cache is not None):
+        start_time = time.time()
+        moves = cache.lookup(pack(board))
+        if(moves is not None):
+            return SearchResult('solved', len(moves), time=time.time() - start_time, moves=moves)
+    if(algorithm == 'ida_star'):
+        result = ida_star_search(board, '2', size, heuristic, time_limit, node_limit, False, on_expand, track_memory)
+    elif(algorithm == 'distance_table'):
+        result = distance_table_search(board, '2', None, False, on_expand, track_memory)
+    elif(algorithm == 'bidirectional'):
+        result = bidirectional_search(board, '2', True, size, time_limit, node_limit, False, on_expand, track_memory)
+    elif(algorithm == 'hda_star'):
+        result = hda_star_search(board, '2', heuristic, workers, True, size, time_limit, node_limit, False)
+    else:
+        result = bidirectional_astar_search(board, '2', heuristic, True, size, time_limit, node_limit, False, on_expand, track_memory)
+    if(cache is not None and result.solved()):
+        cache.record(board, result.moves, size)
+    return result
 
 # The main() function is called when the program is run. It contains a hardcoded initial board for testing or viewing purposes as well as an option to input
 # a custom board. The format for inputting a custom board is from left to right, top to bottom, with 0 as a blank tile and including spaces in between tiles.
-# Next is an option to choose which algorithm to use, 1 for uniform cost, 2 for misplaced tile, and 3 for manhattan. Finally a trace of the search can be 
+# The board size is worked out from the number of tiles entered, so 16 tiles are read as a 15-puzzle.
+# Next is an option to choose which algorithm to use, 1 for uniform cost, 2 for misplaced tile, 3 for manhattan, 4 for IDA* with manhattan, 5 for pattern databases, 6 for linear conflict, 7 for
+# the precomputed 8-puzzle distance table, 8 for blind bidirectional search, 9 for bidirectional A* with manhattan, and 10 for parallel A* with manhattan on every core. Finally a trace of the search can be 
 # included if '1' is entered. the program exits after the appropriate search finishes.
 def main():
     num = input('Type "1" to use a default puzzle or "2" to enter your own puzzle.\n')
@@ -344,14 +1552,29 @@ def main():
         my_list = my_string.split()
         map_object = map(int, my_list)
         init_board = list(map_object)
-    function = input('Enter your choice of algorithm: "1" for Uniform Cost, "2" for A* - Misplaced Tile, or "3" for A* - Manhattan.\n')
+    size = math.isqrt(len(init_board))
+    function = input('Enter your choice of algorithm: "1" for Uniform Cost, "2" for A* - Misplaced Tile, "3" for A* - Manhattan, "4" for IDA* - Manhattan, "5" for A* - Pattern Database, "6" for A* - Linear Conflict, "7" for the 8-Puzzle Distance Table, "8" for Bidirectional, "9" for Bidirectional A* - Manhattan, or "10" for Parallel A* - Manhattan.\n')
     trace = input('Would you like to display a trace of the algorithm? "1" for YES and "2" for NO\n')
     if(function == '1'):
-        uniform_cost_search(init_board, trace)
+        uniform_cost_search(init_board, trace, size=size)
     if(function == '2'):
-        misplaced_tile_search(init_board, trace)
+        misplaced_tile_search(init_board, trace, size=size)
     if(function == '3'):
-        manhattan_search(init_board, trace)
+        manhattan_search(init_board, trace, size=size)
+    if(function == '4'):
+        ida_star_search(init_board, trace, size)
+    if(function == '5'):
+        pattern_database_search(init_board, trace, size=size)
+    if(function == '6'):
+        linear_conflict_search(init_board, trace, size=size)
+    if(function == '7'):
+        distance_table_search(init_board, trace)
+    if(function == '8'):
+        bidirectional_search(init_board, trace, size=size)
+    if(function == '9'):
+        bidirectional_astar_search(init_board, trace, size=size)
+    if(function == '10'):
+        hda_star_search(init_board, trace, size=size)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file